@@ -6,7 +6,7 @@
 
 import signal
 import sys
-from datetime import datetime
+import time
 
 from engine.game_engine import GameEngine
 from utils.logger import GameLogger
@@ -27,6 +27,8 @@ class CommunityRunner:
         self.reflection_system = ReflectionSystem()
         self.private_chat_system = PrivateChatSystem()
         self.statistics = CommunityStatistics()
+        # 本进程内已结束的对局序号，与秒级时间戳组合成唯一的 game_id
+        self._game_seq = 0
         self._running = False
         self._interrupted = False
 
@@ -137,8 +139,9 @@ class CommunityRunner:
 
     def _extract_game_result(self, engine: GameEngine) -> dict:
         """从游戏引擎提取结果"""
+        self._game_seq += 1
         return {
-            "game_id": datetime.now().strftime("%Y%m%d_%H%M%S"),
+            "game_id": f"{int(time.time())}_{self._game_seq}",
             "winner": engine.state.winner,
             "end_reason": engine.state.end_reason,
             "players": [
@@ -51,6 +51,9 @@ MODEL_CONFIG = {
 LLM_TEMPERATURE = 0.8
 LLM_MAX_TOKENS = 1024
 
+# 讨论阶段并行发言：所有玩家同时发言，看不到本轮其他玩家的发言（仅 WebSocket 服务端生效）
+PARALLEL_DISCUSSION = False
+
 # ==================== Memory 配置 ====================
 # 记忆总条数上限，超过此值触发压缩
 MEMORY_COMPRESS_THRESHOLD = 30
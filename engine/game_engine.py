@@ -1,6 +1,5 @@
 """游戏引擎 - 主控制流程"""
 
-import json
 import os
 import random
 from datetime import datetime
@@ -31,10 +30,16 @@ class GameEngine:
     def __init__(self, logger: GameLogger | None = None, persistent_data: dict | None = None):
         self.state = GameState()
         self.agents: dict[int, Agent] = {}
+        self._agents_list: list[Agent] = []  # 按玩家ID排列，供 observe_all 使用
         self.logger = logger or GameLogger()
         self.assassin_phase_data: dict | None = None
         self.persistent_data = persistent_data
 
+        # 按玩家ID索引的只读快照（角色分配后在 _create_agents 中填充）
+        self.player_names: tuple[str, ...] = ()
+        self.player_teams: tuple[str, ...] = ()
+        self.player_role_names: tuple[str, ...] = ()
+
     def setup(self):
         """初始化游戏：分配角色、创建Agent"""
         self.logger.banner("游戏初始化")
@@ -66,6 +71,11 @@ class GameEngine:
 
     def _create_agents(self):
         """创建所有Agent（在夜晚阶段之后调用）"""
+        players = self.state.players
+        self.player_names = tuple(p.player_name for p in players)
+        self.player_teams = tuple(p.team.value for p in players)
+        self.player_role_names = tuple(p.role_name_cn for p in players)
+
         for player in self.state.players:
             agent = Agent(player)
 
@@ -75,6 +85,8 @@ class GameEngine:
 
             self.agents[player.player_id] = agent
 
+        self._agents_list = [self.agents[p.player_id] for p in self.state.players]
+
         # 显示阵营信息（仅日志文件）
         good_players = [p for p in self.state.players if p.is_good]
         evil_players = [p for p in self.state.players if p.is_evil]
@@ -82,6 +94,14 @@ class GameEngine:
         self.logger.system(f"正义阵营 ({len(good_players)}人) 使用模型: {MODEL_CONFIG['good']}")
         self.logger.system(f"邪恶阵营 ({len(evil_players)}人) 使用模型: {MODEL_CONFIG['evil']}")
 
+    def observe_all(self, event: str, skip_id: int | None = None):
+        """让所有 Agent 观察到一条公开事件；skip_id 为事件发起者时跳过该玩家"""
+        agents = self._agents_list
+        if skip_id is not None:
+            agents = agents[:skip_id] + agents[skip_id + 1:]
+        for agent in agents:
+            agent.observe(event)
+
     @staticmethod
     def _extract_player_num(pid: str) -> str:
         """从各种格式的玩家ID中提取数字部分
@@ -302,20 +322,22 @@ class GameEngine:
     def _export_replay_json(self):
         """导出游戏回放JSON文件"""
         try:
-            replay_data = self.state.to_dict()
-            replay_data["game_config"] = {
-                "player_count": PLAYER_COUNT,
-                "mission_team_sizes": MISSION_TEAM_SIZES,
+            extra = {
+                "game_config": {
+                    "player_count": PLAYER_COUNT,
+                    "mission_team_sizes": MISSION_TEAM_SIZES,
+                },
             }
             if self.assassin_phase_data:
-                replay_data["assassin_phase"] = self.assassin_phase_data
+                extra["assassin_phase"] = self.assassin_phase_data
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             log_dir = self.logger.log_dir
             json_path = os.path.join(log_dir, f"replay_{timestamp}.json")
 
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(replay_data, f, ensure_ascii=False, indent=2)
+            # 已定稿轮次的 JSON 片段直接复用，不再整体重新序列化
+            with open(json_path, "wb") as f:
+                f.write(self.state.to_json_bytes(extra))
 
             self.logger.system(f"回放文件已保存: {json_path}")
         except Exception as e:
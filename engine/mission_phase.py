@@ -1,11 +1,32 @@
 """任务执行阶段"""
 
-from models.game_state import GameState, MissionRecord
+from models.game_state import GameState, MissionRecord, PID_STR
 from agents.agent import Agent
 from config import MISSION_FAIL_REQUIRED
 from utils.logger import GameLogger
 
 
+def build_mission_context(state: GameState, team_names_str: str) -> str:
+    """
+    构建任务执行上下文（对所有队员相同）
+
+    Args:
+        state: 游戏状态
+        team_names_str: 执行任务队伍的展示文本
+    """
+    context_parts = [
+        f"你正在执行第{state.current_round + 1}轮任务。",
+        f"队伍成员: {team_names_str}",
+        f"当前比分: 正义 {state.good_wins_count} : {state.evil_wins_count} 邪恶",
+    ]
+
+    if state.mission_records:
+        context_parts.append("\n历史:")
+        context_parts.append(state.get_public_history())
+
+    return "\n".join(context_parts)
+
+
 def execute_mission(
     state: GameState,
     agents: dict[int, Agent],
@@ -26,8 +47,8 @@ def execute_mission(
     """
     logger.phase(f"任务执行阶段 - 第{state.current_round + 1}轮")
 
-    team_names = [f"玩家{t + 1}" for t in state.proposed_team]
-    logger.system(f"执行任务的队伍: {', '.join(team_names)}")
+    team_names_str = ", ".join(f"玩家{t + 1}" for t in state.proposed_team)
+    logger.system(f"执行任务的队伍: {team_names_str}")
 
     # 需要多少张失败票才算失败
     fail_required = MISSION_FAIL_REQUIRED[state.current_round]
@@ -35,28 +56,18 @@ def execute_mission(
     success_count = 0
     fail_count = 0
 
+    # 上下文对所有队员相同，只构建一次
+    context = build_mission_context(state, team_names_str)
+
     for pid in state.proposed_team:
         agent = agents[pid]
         player = state.get_player(pid)
 
-        # 构建任务上下文
-        context_parts = [
-            f"你正在执行第{state.current_round + 1}轮任务。",
-            f"队伍成员: {', '.join(team_names)}",
-            f"当前比分: 正义 {state.good_wins_count} : {state.evil_wins_count} 邪恶",
-        ]
-
-        if state.mission_records:
-            context_parts.append("\n历史:")
-            context_parts.append(state.get_public_history())
-
-        context = "\n".join(context_parts)
-
         # 获取行动
         logger.thinking_start(pid, player.player_name, "deciding mission action")
         action_success = agent.mission_action(context)
         logger.thinking_end(pid, player.player_name)
-        record.mission_votes[pid] = action_success
+        record.mission_votes[PID_STR[pid]] = action_success
 
         if action_success:
             success_count += 1
@@ -78,7 +89,7 @@ def execute_mission(
     logger.mission(mission_success)
 
     # 记录到游戏状态
-    state.mission_results.append(mission_success)
+    state.record_mission_result(mission_success)
 
     # 显示比分
     logger.score(state.good_wins_count, state.evil_wins_count)
@@ -1,10 +1,61 @@
 """投票阶段 - 讨论 + 投票"""
 
-from models.game_state import GameState, MissionRecord
+from models.game_state import GameState, MissionRecord, PID_STR
 from agents.agent import Agent
 from utils.logger import GameLogger
 
 
+def build_discussion_context(state: GameState, team_names_str: str) -> str:
+    """
+    构建讨论阶段发言上下文的固定前缀（不含本轮已有发言）
+
+    Args:
+        state: 游戏状态
+        team_names_str: 提议队伍的展示文本，如 "玩家1, 玩家3"
+    """
+    return "\n".join([
+        f"当前是第{state.current_round + 1}轮任务。",
+        f"队长{state.current_leader.player_name}提议的队伍是: {team_names_str}",
+        "",
+        state.get_public_history(),
+    ])
+
+
+def build_vote_context(state: GameState, record: MissionRecord, team_names_str: str) -> str:
+    """
+    构建组队投票上下文（玩家看不到彼此的投票，上下文对所有人相同）
+
+    Args:
+        state: 游戏状态
+        record: 当前轮次记录（读取本轮发言）
+        team_names_str: 提议队伍的展示文本
+    """
+    context_parts = [
+        f"第{state.current_round + 1}轮任务。",
+        f"队长{state.current_leader.player_name}提议的队伍: {team_names_str}",
+        "",
+        state.get_public_history(),
+    ]
+
+    # 添加本轮发言记录
+    if record.speeches:
+        context_parts.append("\n本轮讨论中的发言:")
+        for spid, speech in record.speeches.items():
+            context_parts.append(f"  玩家{spid + 1}: {speech}")
+
+    failed_info = state.get_failed_team_history_for_round()
+    if failed_info:
+        context_parts.append(f"\n重要提醒: {failed_info}")
+
+    # 强制轮提醒
+    if state.consecutive_rejects >= 4:
+        context_parts.append(
+            "\n【紧急！】这是第5次投票（强制轮），如果这次投票仍不通过，邪恶阵营将直接获胜！"
+        )
+
+    return "\n".join(context_parts)
+
+
 def execute_discussion(
     state: GameState,
     agents: dict[int, Agent],
@@ -22,8 +73,7 @@ def execute_discussion(
     """
     logger.phase("讨论阶段 - 玩家依次发言")
 
-    team_names = [f"玩家{t + 1}" for t in state.proposed_team]
-    leader_name = state.current_leader.player_name
+    team_names_str = ", ".join(f"玩家{t + 1}" for t in state.proposed_team)
 
     # 从队长的下一位开始发言，队长最后发言
     leader_idx = state.current_leader_idx
@@ -33,32 +83,23 @@ def execute_discussion(
         speaking_order.append(idx)
     speaking_order.append(leader_idx)  # 队长最后发言
 
-    all_speeches = []
+    # 发言上下文的固定前缀每轮只构建一次，循环内只追加已有发言
+    context_prefix = build_discussion_context(state, team_names_str)
+    speeches_block = ""
 
     for pid in speaking_order:
         player = state.get_player(pid)
         agent = agents[pid]
 
-        # 构建发言上下文
-        context_parts = [
-            f"当前是第{state.current_round + 1}轮任务。",
-            f"队长{leader_name}提议的队伍是: {', '.join(team_names)}",
-            "",
-            state.get_public_history(),
-        ]
-
-        if all_speeches:
-            context_parts.append("\n已有玩家的发言:")
-            for name, speech in all_speeches:
-                context_parts.append(f"  {name}: {speech}")
-
-        context = "\n".join(context_parts)
+        context = context_prefix + speeches_block
 
         # 获取发言
         logger.thinking_start(pid, player.player_name, "speaking")
         speech = agent.speak(context)
         logger.thinking_end(pid, player.player_name)
-        all_speeches.append((player.player_name, speech))
+        if not speeches_block:
+            speeches_block = "\n\n已有玩家的发言:"
+        speeches_block += f"\n  {player.player_name}: {speech}"
         record.speeches[pid] = speech
 
         # 输出发言
@@ -91,47 +132,23 @@ def execute_vote(
     """
     logger.phase("投票阶段 - 是否同意该队伍出发")
 
-    team_names = [f"玩家{t + 1}" for t in state.proposed_team]
-    leader_name = state.current_leader.player_name
+    team_names_str = ", ".join(f"玩家{t + 1}" for t in state.proposed_team)
 
     approve_count = 0
     reject_count = 0
 
+    # 上下文对所有人相同，只构建一次
+    context = build_vote_context(state, record, team_names_str)
+
     for pid in range(len(state.players)):
         player = state.get_player(pid)
         agent = agents[pid]
 
-        # 构建投票上下文
-        context_parts = [
-            f"第{state.current_round + 1}轮任务。",
-            f"队长{leader_name}提议的队伍: {', '.join(team_names)}",
-            "",
-            state.get_public_history(),
-        ]
-
-        # 添加本轮发言记录
-        if record.speeches:
-            context_parts.append("\n本轮讨论中的发言:")
-            for spid, speech in record.speeches.items():
-                context_parts.append(f"  玩家{spid + 1}: {speech}")
-
-        failed_info = state.get_failed_team_history_for_round()
-        if failed_info:
-            context_parts.append(f"\n重要提醒: {failed_info}")
-
-        # 强制轮提醒
-        if state.consecutive_rejects >= 4:
-            context_parts.append(
-                "\n【紧急！】这是第5次投票（强制轮），如果这次投票仍不通过，邪恶阵营将直接获胜！"
-            )
-
-        context = "\n".join(context_parts)
-
         # 获取投票
         logger.thinking_start(pid, player.player_name, "voting")
         voted = agent.vote_team(context)
         logger.thinking_end(pid, player.player_name)
-        record.team_votes[pid] = voted
+        record.team_votes[PID_STR[pid]] = voted
 
         if voted:
             approve_count += 1
@@ -155,7 +172,7 @@ def execute_vote(
     result_text = "通过" if approved else "未通过"
     event = (
         f"组队投票结果: {result_text} ({approve_count}同意/{reject_count}反对)。"
-        f"队伍: {', '.join(team_names)}"
+        f"队伍: {team_names_str}"
     )
     for agent in agents.values():
         agent.observe(event)
@@ -1,7 +1,38 @@
-"""游戏状态管理"""
+"""游戏状态管理
 
+序列化请统一使用 GameState.to_dict / MissionRecord.to_dict，
+不要对这些模型调用 dataclasses.asdict（会深拷贝每个 Player / RoleInfo）。
+"""
+
+import json
 from dataclasses import dataclass, field
 from models.player import Player
+from config import PLAYER_COUNT
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时退回标准库
+    orjson = None
+
+
+def _dumps(obj) -> bytes:
+    """序列化为紧凑的 UTF-8 JSON 字节串（整数键直接写成字符串键）"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+# 玩家ID → 字符串键（投票字典直接以字符串为键，序列化时无需再转换）
+PID_STR: tuple[str, ...] = tuple(str(pid) for pid in range(PLAYER_COUNT))
+
+# get_public_history 中反复出现的固定前缀
+_LEADER_PREFIX = "队长: "
+_TEAM_PREFIX = "队伍: "
+_TEAM_VOTE_PREFIX = "组队投票: "
+_SPEECHES_HEADER = "发言记录:"
+_MISSION_RESULT_PREFIX = "任务结果: "
+_ALL_SUCCESS_NOTE = "  (全部为成功票)"
+_REJECTED_NOTE = "组队投票结果: 被否决，未执行任务"
 
 
 @dataclass
@@ -10,26 +41,50 @@ class MissionRecord:
     round_num: int                     # 第几轮 (1-5)
     team_leader_id: int                # 队长ID
     team_members: list[int]            # 队伍成员ID
-    team_votes: dict[int, bool] = field(default_factory=dict)  # 组队投票 {player_id: approved}
-    mission_votes: dict[int, bool] = field(default_factory=dict)  # 任务投票 {player_id: success}
+    team_votes: dict[str, bool] = field(default_factory=dict)  # 组队投票 {PID_STR[player_id]: approved}
+    mission_votes: dict[str, bool] = field(default_factory=dict)  # 任务投票 {PID_STR[player_id]: success}
     success: bool | None = None        # 任务是否成功
     speeches: dict[int, str] = field(default_factory=dict)  # 发言记录 {player_id: speech}
+    _cached_json: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def team_approved(self) -> bool:
+        approve_count = sum(1 for v in self.team_votes.values() if v)
+        return approve_count > len(self.team_votes) - approve_count
+
+    @property
+    def is_final(self) -> bool:
+        """记录是否已定稿（任务已执行，或组队已被否决）"""
+        return self.success is not None or (bool(self.team_votes) and not self.team_approved)
 
     def to_dict(self) -> dict:
         """转换为JSON可序列化的字典"""
-        approve_count = sum(1 for v in self.team_votes.values() if v)
-        reject_count = sum(1 for v in self.team_votes.values() if not v)
+        data = self._fields()
+        data["speeches"] = {str(k): v for k, v in self.speeches.items()}
+        return data
+
+    def _fields(self) -> dict:
+        """to_dict 的原始字段；speeches 保留整数键，交给 _dumps 直接序列化"""
         return {
             "round_num": self.round_num,
             "team_leader_id": self.team_leader_id,
             "team_members": self.team_members,
-            "team_votes": {str(k): v for k, v in self.team_votes.items()},
-            "team_approved": approve_count > reject_count,
-            "mission_votes": {str(k): v for k, v in self.mission_votes.items()},
+            "team_votes": self.team_votes,
+            "team_approved": self.team_approved,
+            "mission_votes": self.mission_votes,
             "success": self.success,
-            "speeches": {str(k): v for k, v in self.speeches.items()},
+            "speeches": self.speeches,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """序列化为 JSON 字节串；记录定稿后缓存结果，避免重复序列化"""
+        if self._cached_json is not None:
+            return self._cached_json
+        data = _dumps(self._fields())
+        if self.is_final:
+            self._cached_json = data
+        return data
+
 
 @dataclass
 class GameState:
@@ -44,6 +99,8 @@ class GameState:
     # 任务结果
     mission_results: list[bool] = field(default_factory=list)  # True=成功, False=失败
     mission_records: list[MissionRecord] = field(default_factory=list)  # 详细记录
+    good_wins_count: int = 0           # 成功任务数（随 record_mission_result 累加）
+    evil_wins_count: int = 0           # 失败任务数（随 record_mission_result 累加）
 
     # 当前轮次临时状态
     proposed_team: list[int] = field(default_factory=list)  # 当前提议的队伍
@@ -53,13 +110,10 @@ class GameState:
     winner: str | None = None          # "good" or "evil"
     end_reason: str = ""
 
-    @property
-    def good_wins_count(self) -> int:
-        return sum(1 for r in self.mission_results if r)
-
-    @property
-    def evil_wins_count(self) -> int:
-        return sum(1 for r in self.mission_results if not r)
+    # get_public_history 缓存: ((记录数, 已完成任务数), 文本)
+    _history_cache: tuple[tuple[int, int], str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def current_leader(self) -> Player:
@@ -68,6 +122,14 @@ class GameState:
     def get_player(self, player_id: int) -> Player:
         return self.players[player_id]
 
+    def record_mission_result(self, success: bool):
+        """记录一轮任务结果并同步更新比分"""
+        self.mission_results.append(success)
+        if success:
+            self.good_wins_count += 1
+        else:
+            self.evil_wins_count += 1
+
     def next_leader(self):
         """轮转到下一个队长"""
         self.current_leader_idx = (self.current_leader_idx + 1) % len(self.players)
@@ -77,6 +139,27 @@ class GameState:
 
     def to_dict(self) -> dict:
         """转换为JSON可序列化的字典"""
+        data = self._to_dict_shell()
+        data["mission_records"] = [r.to_dict() for r in self.mission_records]
+        return data
+
+    def to_json_bytes(self, extra: dict | None = None) -> bytes:
+        """
+        序列化为 JSON 字节串。
+
+        mission_records 直接拼接各记录缓存的 JSON 片段，已定稿的轮次不再重复序列化。
+
+        Args:
+            extra: 追加到顶层的额外字段（如 game_config）
+        """
+        shell = self._to_dict_shell()
+        if extra:
+            shell.update(extra)
+        records = b",".join(r.to_json_bytes() for r in self.mission_records)
+        return b'{"mission_records":[' + records + b"]," + _dumps(shell)[1:]
+
+    def _to_dict_shell(self) -> dict:
+        """to_dict 中除 mission_records 以外的部分"""
         return {
             "players": [
                 {
@@ -91,7 +174,6 @@ class GameState:
                 }
                 for p in self.players
             ],
-            "mission_records": [r.to_dict() for r in self.mission_records],
             "mission_results": self.mission_results,
             "good_wins_count": self.good_wins_count,
             "evil_wins_count": self.evil_wins_count,
@@ -104,39 +186,46 @@ class GameState:
         if not self.mission_records:
             return "这是游戏的第一轮，还没有历史记录。"
 
-        lines = []
+        # 记录只在投票结束后追加、任务结果只在任务结束后写入，两者的数量即可标识历史版本
+        version = (len(self.mission_records), len(self.mission_results))
+        if self._history_cache is not None and self._history_cache[0] == version:
+            return self._history_cache[1]
+
+        lines: list[str] = []
         for record in self.mission_records:
-            leader_name = f"玩家{record.team_leader_id + 1}"
-            team_names = [f"玩家{mid + 1}" for mid in record.team_members]
-            lines.append(f"\n--- 第{record.round_num}轮任务 ---")
-            lines.append(f"队长: {leader_name}")
-            lines.append(f"队伍: {', '.join(team_names)}")
+            team_names_str = ", ".join(f"玩家{mid + 1}" for mid in record.team_members)
 
             # 组队投票结果（仅显示票数，不显示具体谁投了什么）
             approve_count = sum(1 for v in record.team_votes.values() if v)
-            reject_count = sum(1 for v in record.team_votes.values() if not v)
-            lines.append(f"组队投票: {approve_count}票同意, {reject_count}票反对")
+            reject_count = len(record.team_votes) - approve_count
+            lines.extend([
+                f"\n--- 第{record.round_num}轮任务 ---",
+                f"{_LEADER_PREFIX}玩家{record.team_leader_id + 1}",
+                f"{_TEAM_PREFIX}{team_names_str}",
+                f"{_TEAM_VOTE_PREFIX}{approve_count}票同意, {reject_count}票反对",
+            ])
 
             # 发言记录
             if record.speeches:
-                lines.append("发言记录:")
+                lines.append(_SPEECHES_HEADER)
                 for pid, speech in record.speeches.items():
                     lines.append(f"  玩家{pid + 1}: {speech}")
 
             # 任务结果
             if record.success is not None:
                 fail_count = sum(1 for v in record.mission_votes.values() if not v)
-                lines.append(f"任务结果: {'成功' if record.success else '失败'}")
-                if fail_count > 0:
-                    lines.append(f"  (出现了{fail_count}张失败票)")
-                else:
-                    lines.append("  (全部为成功票)")
+                lines.extend([
+                    f"{_MISSION_RESULT_PREFIX}{'成功' if record.success else '失败'}",
+                    f"  (出现了{fail_count}张失败票)" if fail_count > 0 else _ALL_SUCCESS_NOTE,
+                ])
             else:
-                lines.append("组队投票结果: 被否决，未执行任务")
+                lines.append(_REJECTED_NOTE)
 
         # 总比分
         lines.append(f"\n当前比分: 正义 {self.good_wins_count} : {self.evil_wins_count} 邪恶")
-        return "\n".join(lines)
+        history = "\n".join(lines)
+        self._history_cache = (version, history)
+        return history
 
     def get_failed_team_history_for_round(self) -> str:
         """获取当前轮次中被否决的组队记录"""
@@ -1,6 +1,8 @@
 """玩家状态管理"""
 
 from dataclasses import dataclass, field
+from typing import Callable
+
 from models.role import RoleInfo, Team
 
 
@@ -17,6 +19,12 @@ class Player:
     known_merlin_or_morgana: list[int] = field(default_factory=list)  # 已知梅林/莫甘娜ID（派西维尔可见）
     known_allies: list[int] = field(default_factory=list)  # 已知的同伴ID（坏人互认）
 
+    # 按角色特化的夜晚信息格式化函数（构造时确定）
+    _night_info_fn: Callable[["Player"], str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._night_info_fn = _build_night_info_fn(self.role)
+
     @property
     def team(self) -> Team:
         return self.role.team
@@ -35,23 +43,47 @@ class Player:
 
     def get_night_info(self) -> str:
         """获取夜晚信息的文字描述"""
-        info_parts = []
+        return self._night_info_fn(self)
+
+
+_NO_NIGHT_INFO = "你在夜晚没有获得任何特殊信息。"
+
+
+def _format_names(player_ids: list[int]) -> str:
+    return ", ".join(f"玩家{pid + 1}" for pid in player_ids)
+
+
+def _merlin_night_info(player: Player) -> str:
+    if not player.known_evil:
+        return _NO_NIGHT_INFO
+    return f"你看到以下玩家是邪恶阵营: {_format_names(player.known_evil)}"
+
+
+def _percival_night_info(player: Player) -> str:
+    if not player.known_merlin_or_morgana:
+        return _NO_NIGHT_INFO
+    return (
+        "你看到以下玩家中有梅林和莫甘娜（但你不知道谁是谁）: "
+        f"{_format_names(player.known_merlin_or_morgana)}"
+    )
+
 
-        if self.role.can_see_evil and self.known_evil:
-            evil_names = [f"玩家{eid + 1}" for eid in self.known_evil]
-            info_parts.append(f"你看到以下玩家是邪恶阵营: {', '.join(evil_names)}")
+def _evil_night_info(player: Player) -> str:
+    if not player.known_allies:
+        return _NO_NIGHT_INFO
+    return f"你的邪恶同伴是: {_format_names(player.known_allies)}"
 
-        if self.role.can_see_merlin and self.known_merlin_or_morgana:
-            mm_names = [f"玩家{mid + 1}" for mid in self.known_merlin_or_morgana]
-            info_parts.append(
-                f"你看到以下玩家中有梅林和莫甘娜（但你不知道谁是谁）: {', '.join(mm_names)}"
-            )
 
-        if self.is_evil and self.known_allies:
-            ally_names = [f"玩家{aid + 1}" for aid in self.known_allies]
-            info_parts.append(f"你的邪恶同伴是: {', '.join(ally_names)}")
+def _plain_night_info(player: Player) -> str:
+    return _NO_NIGHT_INFO
 
-        if not info_parts:
-            info_parts.append("你在夜晚没有获得任何特殊信息。")
 
-        return "\n".join(info_parts)
+def _build_night_info_fn(role: RoleInfo) -> Callable[[Player], str]:
+    """根据角色一次性选定夜晚信息的格式化函数（当前每个角色至多具备一种夜晚视野）"""
+    if role.can_see_evil:
+        return _merlin_night_info
+    if role.can_see_merlin:
+        return _percival_night_info
+    if role.team == Team.EVIL:
+        return _evil_night_info
+    return _plain_night_info
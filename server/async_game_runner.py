@@ -5,20 +5,26 @@
 """
 
 import asyncio
+import json
 import time
-from datetime import datetime
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
-from server.event_emitter import EventEmitter
+from server.event_emitter import EventEmitter, PrivateChatMsg
 
 from engine.game_engine import GameEngine
 from engine.night_phase import execute_night_phase
 from engine.team_phase import execute_team_phase
-from engine.vote_phase import execute_discussion, execute_vote
-from engine.mission_phase import execute_mission
+from engine.vote_phase import (
+    execute_discussion,
+    execute_vote,
+    build_discussion_context,
+    build_vote_context,
+)
+from engine.mission_phase import execute_mission, build_mission_context
 from engine.assassin_phase import execute_assassin_phase
 from utils.logger import GameLogger
-from models.game_state import MissionRecord
+from models.game_state import MissionRecord, PID_STR
 from community.persistent_agent import PersistentAgentManager, PersistentAgentData
 from community.reflection import ReflectionSystem
 from community.private_chat import PrivateChatSystem
@@ -28,6 +34,7 @@ from config import (
     MISSION_TEAM_SIZES,
     MISSION_FAIL_REQUIRED,
     MAX_TEAM_VOTES,
+    PARALLEL_DISCUSSION,
     COMMUNITY_DATA_DIR,
     STATS_REPORT_INTERVAL,
 )
@@ -54,9 +61,34 @@ class AsyncGameRunner:
         self.state = self.STATE_IDLE
         self.step_mode = False
 
+        # 专用线程池（由 _open_executors / _close_executors 管理生命周期）
+        # - engine: 单线程，串行执行修改引擎状态的步骤（setup / 夜晚 / 组队 / 刺杀）
+        # - agent: 每位玩家一个线程，承载 Agent 的 LLM 调用
+        self._engine_executor: ThreadPoolExecutor | None = None
+        self._agent_executor: ThreadPoolExecutor | None = None
+
+        # 运行中的事件循环（在 run_single_game / run_community_session 入口处缓存）
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # 发言顺序只取决于队长位置，共 PLAYER_COUNT 种，预先算好：
+        # 从队长的下一位开始，队长最后发言
+        self._speaker_rotation: dict[int, tuple[int, ...]] = {
+            leader: tuple((leader + i) % PLAYER_COUNT for i in range(1, PLAYER_COUNT)) + (leader,)
+            for leader in range(PLAYER_COUNT)
+        }
+        self._vote_order: tuple[int, ...] = tuple(range(PLAYER_COUNT))
+
+        # 由 CommandHandler 启动的运行任务（stop 时取消）
+        self._task: asyncio.Task | None = None
+
         # 当前引擎引用（用于查询）
         self.engine: GameEngine | None = None
+        self._players_info_cache: list[dict] = []
+        # 上次发送给前端的各 Agent profile 的哈希（player_id → hash），用于增量发送 all_agents
+        self._last_profile_hash: dict[int, int] = {}
         self.statistics = CommunityStatistics()
+        # 本进程内已结束的对局序号，与秒级时间戳组合成唯一的 game_id
+        self._game_seq = 0
 
     # ------------------------------------------------------------------
     # 控制方法
@@ -89,10 +121,55 @@ class AsyncGameRunner:
         if self.state == self.STATE_PAUSED:
             self._pause_event.set()
 
+    def _open_executors(self) -> bool:
+        """创建线程池；若已存在则复用。返回本次调用是否新建了线程池。"""
+        if self._agent_executor is not None:
+            return False
+        self._engine_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="engine"
+        )
+        self._agent_executor = ThreadPoolExecutor(
+            max_workers=PLAYER_COUNT, thread_name_prefix="agent"
+        )
+        return True
+
+    def _close_executors(self):
+        """关闭线程池"""
+        for executor in (self._engine_executor, self._agent_executor):
+            if executor is not None:
+                executor.shutdown(wait=False)
+        self._engine_executor = None
+        self._agent_executor = None
+
+    # ------------------------------------------------------------------
+    # 磁盘写入（放到引擎线程，不阻塞事件循环）
+    # ------------------------------------------------------------------
+
+    async def _reveal_and_export(self, engine: GameEngine):
+        """公布身份并导出回放 JSON 文件"""
+        def finish():
+            engine._reveal_identities()
+            engine._export_replay_json()
+
+        await self._loop.run_in_executor(self._engine_executor, finish)
+
+    async def _close_logger(self, logger: GameLogger):
+        """关闭日志：等待后台线程写完剩余日志并落盘"""
+        await self._loop.run_in_executor(self._engine_executor, logger.close)
+
     # ------------------------------------------------------------------
     # checkpoint
     # ------------------------------------------------------------------
 
+    def _should_yield_cheap(self) -> bool:
+        """
+        同步判断 checkpoint 是否需要真正处理（停止 / 单步 / 暂停）。
+
+        逐人循环内部用 `if self._should_yield_cheap(): await self._checkpoint()`，
+        常见的无事可做情况下连协程对象都不创建；阶段入口仍无条件 await _checkpoint()。
+        """
+        return self._stop_requested or self.step_mode or not self._pause_event.is_set()
+
     async def _checkpoint(self):
         """
         在每个关键步骤之间调用。
@@ -100,6 +177,10 @@ class AsyncGameRunner:
         - 如果处于暂停状态，等待 resume / step 信号
         - 如果收到 stop 信号，抛出 _StopGame
         """
+        # 快速路径：未停止、非单步、未暂停时直接返回，不产生协程挂起
+        if not self._should_yield_cheap():
+            return
+
         if self._stop_requested:
             raise _StopGame()
 
@@ -108,11 +189,27 @@ class AsyncGameRunner:
             self.state = self.STATE_PAUSED
             await self.emitter.emit("runner_paused", {"reason": "step"})
 
-        await self._pause_event.wait()
+        if not self._pause_event.is_set():
+            # 暂停前确保前端已收到此前的全部事件
+            await self.emitter.flush()
+            await self._pause_event.wait()
 
         if self._stop_requested:
             raise _StopGame()
 
+    @asynccontextmanager
+    async def _phase(self, name: str, **extra):
+        """
+        阶段事件包装：进入时推送 phase_started，正常结束时推送 phase_completed。
+
+        产出 phase_completed 的数据字典，阶段内可以向其中追加字段；
+        阶段因异常（如停止游戏）中断时不推送 phase_completed。
+        """
+        await self.emitter.emit("phase_started", {"phase": name, **extra})
+        completed = {"phase": name, **extra}
+        yield completed
+        await self.emitter.emit("phase_completed", completed)
+
     # ------------------------------------------------------------------
     # 社区模式入口
     # ------------------------------------------------------------------
@@ -122,6 +219,8 @@ class AsyncGameRunner:
         self.state = self.STATE_RUNNING
         self._stop_requested = False
         self._pause_event.set()
+        self._loop = asyncio.get_running_loop()
+        owns_executors = self._open_executors()
 
         agent_manager = PersistentAgentManager(COMMUNITY_DATA_DIR)
 
@@ -168,8 +267,10 @@ class AsyncGameRunner:
                 # 私聊阶段
                 await self._run_private_chat_phase(engine, game_result, agent_manager)
 
-                # 保存
-                agent_manager.save_all_agents()
+                # 保存（逐个写 JSON 文件，放到引擎线程执行）
+                await self._loop.run_in_executor(
+                    self._engine_executor, agent_manager.save_all_agents
+                )
 
                 stats_report = self.statistics.generate_report()
                 await self.emitter.emit("stats_update", stats_report)
@@ -180,7 +281,12 @@ class AsyncGameRunner:
 
         except _StopGame:
             await self.emitter.emit("session_stopped", {"games_completed": game_count})
+        except asyncio.CancelledError:
+            self.emitter.enqueue("session_stopped", {"games_completed": game_count})
+            raise
         finally:
+            if owns_executors:
+                self._close_executors()
             self.state = self.STATE_FINISHED
             await self.emitter.emit(
                 "session_ended",
@@ -199,25 +305,28 @@ class AsyncGameRunner:
             self._stop_requested = False
             self._pause_event.set()
 
-        loop = asyncio.get_event_loop()
+        self._loop = asyncio.get_running_loop()
+        owns_executors = self._open_executors()
 
         logger = GameLogger(log_dir=self.log_dir)
         engine = GameEngine(logger=logger, persistent_data=persistent_data)
         self.engine = engine
         self._current_persistent_data = persistent_data  # 保存引用供 profile 使用
+        # 上一局的玩家身份快照作废，在本局 Agent 创建后重新构建
+        self._players_info_cache = []
 
         try:
             # 1. 初始化
-            await loop.run_in_executor(None, engine.setup)
+            await self._loop.run_in_executor(self._engine_executor, engine.setup)
 
             # 2. 夜晚阶段
-            await self._run_night_phase(engine, loop)
+            await self._run_night_phase(engine)
 
             # 3. 创建 Agent
             engine._create_agents()
 
-            # 通知: 游戏开始
-            players_info = [
+            # 通知: 游戏开始（玩家身份信息在本局内不变，只构建一次）
+            self._players_info_cache = [
                 {
                     "player_id": p.player_id,
                     "player_name": p.player_name,
@@ -230,20 +339,20 @@ class AsyncGameRunner:
             await self.emitter.emit(
                 "game_started",
                 {
-                    "players": players_info,
+                    "players": self._players_info_cache,
                     "leader_idx": engine.state.current_leader_idx,
                 },
             )
 
             # 发送所有 Agent profile 到前端 AGENTS 面板
-            await self._emit_all_agents(engine, persistent_data)
+            await self._emit_all_agents(engine, persistent_data, full=True)
 
             # 4. 任务轮次 (最多 5 轮)
             for round_num in range(5):
                 engine.state.current_round = round_num
                 await self._checkpoint()
 
-                round_result = await self._run_round(engine, round_num, loop)
+                round_result = await self._run_round(engine, round_num)
                 if round_result is None:
                     # stop 请求
                     break
@@ -259,11 +368,11 @@ class AsyncGameRunner:
                     {
                         "winner": engine.state.winner,
                         "reason": engine.state.end_reason,
-                        "players": players_info,
+                        "players": self._players_info_cache,
                     },
                 )
 
-            logger.close()
+            await self._close_logger(logger)
             return engine
 
         except _StopGame:
@@ -271,27 +380,32 @@ class AsyncGameRunner:
                 "game_stopped",
                 {"reason": "用户终止"},
             )
-            logger.close()
+            await self._close_logger(logger)
             return engine
+        except asyncio.CancelledError:
+            # 运行任务被取消（stop 命令）：与 _StopGame 一样通知前端，再继续传播取消
+            self.emitter.enqueue("game_stopped", {"reason": "用户终止"})
+            logger.close()
+            raise
+        finally:
+            if owns_executors:
+                self._close_executors()
 
     # ------------------------------------------------------------------
     # 夜晚阶段
     # ------------------------------------------------------------------
 
-    async def _run_night_phase(self, engine: GameEngine, loop: asyncio.AbstractEventLoop):
-        await self.emitter.emit("phase_started", {"phase": "night"})
-        await loop.run_in_executor(
-            None, execute_night_phase, engine.state, engine.logger
-        )
-        await self.emitter.emit("phase_completed", {"phase": "night"})
+    async def _run_night_phase(self, engine: GameEngine):
+        async with self._phase("night"):
+            await self._loop.run_in_executor(
+                self._engine_executor, execute_night_phase, engine.state, engine.logger
+            )
 
     # ------------------------------------------------------------------
     # 单轮: 组队 → 讨论 → 投票 → 任务
     # ------------------------------------------------------------------
 
-    async def _run_round(
-        self, engine: GameEngine, round_num: int, loop: asyncio.AbstractEventLoop
-    ):
+    async def _run_round(self, engine: GameEngine, round_num: int):
         """运行一轮完整的 组队→讨论→投票→(任务) 循环，处理否决重试。"""
 
         team_size = MISSION_TEAM_SIZES[round_num]
@@ -306,41 +420,37 @@ class AsyncGameRunner:
         )
 
         engine.state.consecutive_rejects = 0
-        team_approved = False
 
-        while not team_approved:
+        # 每次迭代是一次组队提议；连续 MAX_TEAM_VOTES 次被否决时循环自然结束，进入 else
+        for _attempt in range(MAX_TEAM_VOTES):
             await self._checkpoint()
 
             leader_idx = engine.state.current_leader_idx
             leader_name = engine.state.current_leader.player_name
 
             # ---- 组队 ----
-            await self.emitter.emit(
-                "phase_started",
-                {
-                    "phase": "team_proposal",
-                    "round": round_num + 1,
-                    "leader_id": leader_idx,
-                },
-            )
-
-            await self.emitter.emit(
-                "agent_thinking",
-                {"player_id": leader_idx, "action": "proposing_team"},
-            )
+            async with self._phase("team_proposal", round=round_num + 1, leader_id=leader_idx):
+                await self.emitter.emit(
+                    "agent_thinking",
+                    {"player_id": leader_idx, "action": "proposing_team"},
+                )
 
-            team = await loop.run_in_executor(
-                None, execute_team_phase, engine.state, engine.agents, engine.logger
-            )
+                team = await self._loop.run_in_executor(
+                    self._engine_executor,
+                    execute_team_phase,
+                    engine.state,
+                    engine.agents,
+                    engine.logger,
+                )
 
-            await self.emitter.emit(
-                "team_proposed",
-                {
-                    "leader_id": leader_idx,
-                    "team": list(team),
-                    "round": round_num + 1,
-                },
-            )
+                await self.emitter.emit(
+                    "team_proposed",
+                    {
+                        "leader_id": leader_idx,
+                        "team": list(team),
+                        "round": round_num + 1,
+                    },
+                )
 
             # 创建任务记录
             record = MissionRecord(
@@ -350,36 +460,19 @@ class AsyncGameRunner:
             )
 
             # ---- 讨论 ----
-            await self._run_discussion(engine, record, round_num, loop)
+            await self._run_discussion(engine, record, round_num)
 
             # ---- 投票 ----
-            approved = await self._run_vote(engine, record, round_num, loop)
+            approved = await self._run_vote(engine, record, round_num)
 
             # 保存记录
             engine.state.mission_records.append(record)
 
-            if not approved:
-                engine.state.consecutive_rejects += 1
-
-                # 5 次否决 → 邪恶获胜
-                if engine.state.consecutive_rejects >= MAX_TEAM_VOTES:
-                    engine.state.game_over = True
-                    engine.state.winner = "evil"
-                    engine.state.end_reason = "连续5次组队被否决，邪恶阵营获胜！"
-                    engine.logger.result(engine.state.end_reason, good_wins=False)
-                    engine._reveal_identities()
-                    engine._export_replay_json()
-
-                    await self.emitter.emit(
-                        "game_ended",
-                        {
-                            "winner": "evil",
-                            "reason": engine.state.end_reason,
-                            "players": self._players_info(engine),
-                        },
-                    )
-                    return None
+            if approved:
+                break
 
+            engine.state.consecutive_rejects += 1
+            if engine.state.consecutive_rejects < MAX_TEAM_VOTES:
                 # 换队长
                 engine.state.next_leader()
                 engine.logger.system(
@@ -389,16 +482,31 @@ class AsyncGameRunner:
                     "leader_changed",
                     {"new_leader_id": engine.state.current_leader_idx},
                 )
-            else:
-                team_approved = True
+        else:
+            # 5 次否决 → 邪恶获胜
+            engine.state.game_over = True
+            engine.state.winner = "evil"
+            engine.state.end_reason = "连续5次组队被否决，邪恶阵营获胜！"
+            engine.logger.result(engine.state.end_reason, good_wins=False)
+            await self._reveal_and_export(engine)
+
+            await self.emitter.emit(
+                "game_ended",
+                {
+                    "winner": "evil",
+                    "reason": engine.state.end_reason,
+                    "players": self._players_info_cache,
+                },
+            )
+            return None
 
         # ---- 执行任务 ----
-        await self._run_mission(engine, record, round_num, loop)
+        await self._run_mission(engine, record, round_num)
 
         # 检查胜负
         if engine.state.good_wins_count >= 3:
             # 进入刺杀阶段
-            assassin_result = await self._run_assassin_phase(engine, loop)
+            assassin_result = await self._run_assassin_phase(engine)
             engine.assassin_phase_data = assassin_result
 
             if assassin_result["merlin_killed"]:
@@ -412,8 +520,7 @@ class AsyncGameRunner:
                 engine.state.end_reason = "正义阵营完成三次任务且梅林存活！正义阵营获胜！"
                 engine.logger.result(engine.state.end_reason, good_wins=True)
 
-            engine._reveal_identities()
-            engine._export_replay_json()
+            await self._reveal_and_export(engine)
             return True
 
         if engine.state.evil_wins_count >= 3:
@@ -421,8 +528,7 @@ class AsyncGameRunner:
             engine.state.winner = "evil"
             engine.state.end_reason = "三次任务失败！邪恶阵营获胜！"
             engine.logger.result(engine.state.end_reason, good_wins=False)
-            engine._reveal_identities()
-            engine._export_replay_json()
+            await self._reveal_and_export(engine)
             return True
 
         # 下一轮，轮转队长
@@ -438,74 +544,104 @@ class AsyncGameRunner:
         engine: GameEngine,
         record: MissionRecord,
         round_num: int,
-        loop: asyncio.AbstractEventLoop,
     ):
-        await self.emitter.emit(
-            "phase_started",
-            {"phase": "discussion", "round": round_num + 1},
-        )
+        # 热路径上反复访问的属性链在阶段入口绑定为局部变量
+        state = engine.state
+        agents = engine.agents
+        player_names = engine.player_names
 
-        engine.logger.phase("讨论阶段 - 玩家依次发言")
+        async with self._phase("discussion", round=round_num + 1):
+            engine.logger.phase("讨论阶段 - 玩家依次发言")
 
-        team_names = [f"玩家{t + 1}" for t in engine.state.proposed_team]
-        leader_name = engine.state.current_leader.player_name
-        leader_idx = engine.state.current_leader_idx
+            team_names_str = ", ".join(f"玩家{t + 1}" for t in state.proposed_team)
+            speaking_order = self._speaker_rotation[state.current_leader_idx]
 
-        # 从队长的下一位开始，队长最后发言
-        speaking_order = []
-        for i in range(1, len(engine.state.players)):
-            idx = (leader_idx + i) % len(engine.state.players)
-            speaking_order.append(idx)
-        speaking_order.append(leader_idx)
+            # 公开历史在本阶段内不变，前缀只构建一次
+            context_prefix = build_discussion_context(state, team_names_str)
 
-        all_speeches: list[tuple[str, str]] = []
+            if PARALLEL_DISCUSSION:
+                await self._run_parallel_speeches(
+                    engine, record, round_num, speaking_order, context_prefix
+                )
+                return
 
-        for pid in speaking_order:
-            await self._checkpoint()
+            # 本轮已有发言，随每次发言增量追加，避免为每位发言者重建
+            speeches_block = ""
 
-            player = engine.state.get_player(pid)
-            agent = engine.agents[pid]
+            for pid in speaking_order:
+                if self._should_yield_cheap():
+                    await self._checkpoint()
 
-            await self.emitter.emit(
-                "agent_thinking",
-                {"player_id": pid, "action": "speaking"},
-            )
+                agent = agents[pid]
 
-            # 构建发言上下文（与 vote_phase.py 中的 execute_discussion 一致）
-            context_parts = [
-                f"当前是第{round_num + 1}轮任务。",
-                f"队长{leader_name}提议的队伍是: {', '.join(team_names)}",
-                "",
-                engine.state.get_public_history(),
-            ]
-            if all_speeches:
-                context_parts.append("\n已有玩家的发言:")
-                for name, speech in all_speeches:
-                    context_parts.append(f"  {name}: {speech}")
-            context = "\n".join(context_parts)
+                self.emitter.enqueue(
+                    "agent_thinking",
+                    {"player_id": pid, "action": "speaking"},
+                )
 
-            speech = await loop.run_in_executor(None, agent.speak, context)
-            all_speeches.append((player.player_name, speech))
-            record.speeches[pid] = speech
+                context = context_prefix + speeches_block
 
-            # 日志
-            engine.logger.speech(player.player_name, player.team.value, speech)
+                speech = await self._loop.run_in_executor(
+                    self._agent_executor, agent.speak, context
+                )
+                if not speeches_block:
+                    speeches_block = "\n\n已有玩家的发言:"
+                speeches_block += f"\n  {player_names[pid]}: {speech}"
+                self._publish_speech(engine, record, round_num, pid, speech)
 
-            # 通知其他 Agent 观察到发言
-            event_text = f"{player.player_name}发言: {speech}"
-            for other_agent in engine.agents.values():
-                if other_agent.player_id != pid:
-                    other_agent.observe(event_text)
+    async def _run_parallel_speeches(
+        self,
+        engine: GameEngine,
+        record: MissionRecord,
+        round_num: int,
+        speaking_order: tuple[int, ...],
+        context: str,
+    ):
+        """并行发言模式：所有玩家基于同一上下文同时发言，结果按发言顺序公布。"""
+        await self._checkpoint()
 
-            await self.emitter.emit(
-                "agent_speech",
-                {
-                    "player_id": pid,
-                    "player_name": player.player_name,
-                    "text": speech,
-                    "round": round_num + 1,
-                },
+        await self.emitter.emit_many([
+            ("agent_thinking", {"player_id": pid, "action": "speaking"})
+            for pid in speaking_order
+        ])
+
+        speeches = await asyncio.gather(*[
+            self._loop.run_in_executor(
+                self._agent_executor, engine.agents[pid].speak, context
             )
+            for pid in speaking_order
+        ])
+
+        for pid, speech in zip(speaking_order, speeches):
+            self._publish_speech(engine, record, round_num, pid, speech)
+
+    def _publish_speech(
+        self,
+        engine: GameEngine,
+        record: MissionRecord,
+        round_num: int,
+        pid: int,
+        speech: str,
+    ):
+        """记录一条发言：写入记录与日志、让其他 Agent 观察，并推送到前端。"""
+        player_name = engine.player_names[pid]
+        record.speeches[pid] = speech
+
+        # 日志
+        engine.logger.speech(player_name, engine.player_teams[pid], speech)
+
+        # 通知其他 Agent 观察到发言
+        engine.observe_all(f"{player_name}发言: {speech}", skip_id=pid)
+
+        self.emitter.enqueue(
+            "agent_speech",
+            {
+                "player_id": pid,
+                "player_name": player_name,
+                "text": speech,
+                "round": round_num + 1,
+            },
+        )
 
     # ------------------------------------------------------------------
     # 投票阶段（逐人投票）
@@ -516,110 +652,93 @@ class AsyncGameRunner:
         engine: GameEngine,
         record: MissionRecord,
         round_num: int,
-        loop: asyncio.AbstractEventLoop,
     ) -> bool:
-        await self.emitter.emit(
-            "phase_started",
-            {"phase": "vote", "round": round_num + 1},
-        )
+        # 热路径上反复访问的属性链在阶段入口绑定为局部变量
+        state = engine.state
+        agents = engine.agents
+        player_names = engine.player_names
 
-        engine.logger.phase("投票阶段 - 是否同意该队伍出发")
+        async with self._phase("vote", round=round_num + 1):
+            engine.logger.phase("投票阶段 - 是否同意该队伍出发")
 
-        team_names = [f"玩家{t + 1}" for t in engine.state.proposed_team]
-        leader_name = engine.state.current_leader.player_name
+            team_names_str = ", ".join(f"玩家{t + 1}" for t in state.proposed_team)
 
-        approve_count = 0
-        reject_count = 0
+            # 玩家之间互相看不到投票，上下文对所有人相同，可以同时发起
+            context = build_vote_context(state, record, team_names_str)
 
-        for pid in range(len(engine.state.players)):
             await self._checkpoint()
 
-            player = engine.state.get_player(pid)
-            agent = engine.agents[pid]
-
-            await self.emitter.emit(
-                "agent_thinking",
-                {"player_id": pid, "action": "voting"},
-            )
+            voter_ids = self._vote_order
+            await self.emitter.emit_many([
+                ("agent_thinking", {"player_id": pid, "action": "voting"})
+                for pid in voter_ids
+            ])
 
-            # 构建投票上下文（与 vote_phase.py 中的 execute_vote 一致）
-            context_parts = [
-                f"第{round_num + 1}轮任务。",
-                f"队长{leader_name}提议的队伍: {', '.join(team_names)}",
-                "",
-                engine.state.get_public_history(),
-            ]
-            if record.speeches:
-                context_parts.append("\n本轮讨论中的发言:")
-                for spid, speech in record.speeches.items():
-                    context_parts.append(f"  玩家{spid + 1}: {speech}")
-
-            failed_info = engine.state.get_failed_team_history_for_round()
-            if failed_info:
-                context_parts.append(f"\n重要提醒: {failed_info}")
-
-            if engine.state.consecutive_rejects >= 4:
-                context_parts.append(
-                    "\n【紧急！】这是第5次投票（强制轮），如果这次投票仍不通过，邪恶阵营将直接获胜！"
+            votes = await asyncio.gather(*[
+                self._loop.run_in_executor(
+                    self._agent_executor, agents[pid].vote_team, context
                 )
+                for pid in voter_ids
+            ])
 
-            context = "\n".join(context_parts)
+            approve_count = 0
+            reject_count = 0
+            # 所有票同时揭晓，逐票事件与最终结果合并为一次广播
+            vote_events: list[tuple[str, dict]] = []
 
-            voted = await loop.run_in_executor(None, agent.vote_team, context)
-            record.team_votes[pid] = voted
+            for pid, voted in zip(voter_ids, votes):
+                player_name = player_names[pid]
+                record.team_votes[PID_STR[pid]] = voted
 
-            if voted:
-                approve_count += 1
-            else:
-                reject_count += 1
+                if voted:
+                    approve_count += 1
+                else:
+                    reject_count += 1
 
-            engine.logger.vote(player.player_name, voted)
+                engine.logger.vote(player_name, voted)
 
-            await self.emitter.emit(
-                "agent_vote",
-                {
-                    "player_id": pid,
-                    "player_name": player.player_name,
-                    "approved": voted,
-                },
-            )
+                vote_events.append((
+                    "agent_vote",
+                    {
+                        "player_id": pid,
+                        "player_name": player_name,
+                        "approved": voted,
+                    },
+                ))
 
-        # 判定
-        approved = approve_count > reject_count
+            # 判定
+            approved = approve_count > reject_count
 
-        if approved:
-            engine.logger.system(
-                f"投票通过！({approve_count}票同意, {reject_count}票反对) 队伍出发执行任务！"
-            )
-        else:
-            engine.logger.system(
-                f"投票未通过！({approve_count}票同意, {reject_count}票反对) 换下一个队长组队。"
-            )
+            if approved:
+                engine.logger.system(
+                    f"投票通过！({approve_count}票同意, {reject_count}票反对) 队伍出发执行任务！"
+                )
+            else:
+                engine.logger.system(
+                    f"投票未通过！({approve_count}票同意, {reject_count}票反对) 换下一个队长组队。"
+                )
 
-        # 通知所有 Agent
-        result_text = "通过" if approved else "未通过"
-        event_text = (
-            f"组队投票结果: {result_text} ({approve_count}同意/{reject_count}反对)。"
-            f"队伍: {', '.join(team_names)}"
-        )
-        for agent in engine.agents.values():
-            agent.observe(event_text)
+            # 通知所有 Agent
+            result_text = "通过" if approved else "未通过"
+            event_text = (
+                f"组队投票结果: {result_text} ({approve_count}同意/{reject_count}反对)。"
+                f"队伍: {team_names_str}"
+            )
+            engine.observe_all(event_text)
 
-        votes_detail = {
-            str(pid): v for pid, v in record.team_votes.items()
-        }
-        await self.emitter.emit(
-            "vote_result",
-            {
-                "approved": approved,
-                "approve_count": approve_count,
-                "reject_count": reject_count,
-                "votes": votes_detail,
-                "round": round_num + 1,
-            },
-        )
+            vote_events.append((
+                "vote_result",
+                {
+                    "approved": approved,
+                    "approve_count": approve_count,
+                    "reject_count": reject_count,
+                    "votes": record.team_votes,
+                    "round": round_num + 1,
+                },
+            ))
+            await self.emitter.emit_many(vote_events)
 
-        return approved
+            return approved
 
     # ------------------------------------------------------------------
     # 任务执行阶段
@@ -630,136 +749,141 @@ class AsyncGameRunner:
         engine: GameEngine,
         record: MissionRecord,
         round_num: int,
-        loop: asyncio.AbstractEventLoop,
     ):
-        await self.emitter.emit(
-            "phase_started",
-            {"phase": "mission", "round": round_num + 1},
-        )
+        # 热路径上反复访问的属性链在阶段入口绑定为局部变量
+        state = engine.state
+        players = state.players
+        agents = engine.agents
 
-        engine.logger.phase(f"任务执行阶段 - 第{round_num + 1}轮")
+        async with self._phase("mission", round=round_num + 1):
+            engine.logger.phase(f"任务执行阶段 - 第{round_num + 1}轮")
 
-        team_names = [f"玩家{t + 1}" for t in engine.state.proposed_team]
-        engine.logger.system(f"执行任务的队伍: {', '.join(team_names)}")
+            team_names_str = ", ".join(f"玩家{t + 1}" for t in state.proposed_team)
+            engine.logger.system(f"执行任务的队伍: {team_names_str}")
 
-        fail_required = MISSION_FAIL_REQUIRED[round_num]
-        success_count = 0
-        fail_count = 0
+            fail_required = MISSION_FAIL_REQUIRED[round_num]
+            success_count = 0
+            fail_count = 0
 
-        for pid in engine.state.proposed_team:
             await self._checkpoint()
 
-            agent = engine.agents[pid]
-            player = engine.state.get_player(pid)
+            team = state.proposed_team
+            evil_ids = [pid for pid in team if players[pid].is_evil]
 
-            if player.is_good:
-                # 好人只能投成功
-                record.mission_votes[pid] = True
-                success_count += 1
-                engine.logger.secret(
-                    f"玩家{pid + 1}({player.role_name_cn}) 投了 [成功] 票"
-                )
+            if not evil_ids:
+                # 全员正义：好人只能投成功，结果确定，无需逐人判定
+                record.mission_votes.update(dict.fromkeys((PID_STR[pid] for pid in team), True))
+                success_count = len(team)
+                engine.logger.secret(f"队伍全员为正义阵营，{team_names_str} 均投了 [成功] 票")
             else:
-                await self.emitter.emit(
-                    "agent_thinking",
-                    {"player_id": pid, "action": "mission_vote"},
-                )
-
-                # 构建任务上下文（与 mission_phase.py 一致）
-                context_parts = [
-                    f"你正在执行第{round_num + 1}轮任务。",
-                    f"队伍成员: {', '.join(team_names)}",
-                    f"当前比分: 正义 {engine.state.good_wins_count} : {engine.state.evil_wins_count} 邪恶",
-                ]
-                if engine.state.mission_records:
-                    context_parts.append("\n历史:")
-                    context_parts.append(engine.state.get_public_history())
-                context = "\n".join(context_parts)
-
-                action_success = await loop.run_in_executor(
-                    None, agent.mission_action, context
-                )
-                record.mission_votes[pid] = action_success
-
-                if action_success:
-                    success_count += 1
-                else:
-                    fail_count += 1
-
-                action_text = "成功" if action_success else "失败"
-                engine.logger.secret(
-                    f"玩家{pid + 1}({player.role_name_cn}) 投了 [{action_text}] 票"
-                )
+                context = build_mission_context(state, team_names_str)
 
-                await self.emitter.emit(
-                    "agent_mission_vote",
-                    {"player_id": pid, "success": action_success},
-                )
+                await self.emitter.emit_many([
+                    ("agent_thinking", {"player_id": pid, "action": "mission_vote"})
+                    for pid in evil_ids
+                ])
 
-        # 判定
-        mission_success = fail_count < fail_required
-        record.success = mission_success
+                # 坏人的任务决策互相独立，同时发起 LLM 调用
+                actions = await asyncio.gather(*[
+                    self._loop.run_in_executor(
+                        self._agent_executor, agents[pid].mission_action, context
+                    )
+                    for pid in evil_ids
+                ])
+                evil_actions = dict(zip(evil_ids, actions))
+
+                for pid in team:
+                    player = players[pid]
+
+                    if player.is_good:
+                        # 好人只能投成功
+                        record.mission_votes[PID_STR[pid]] = True
+                        success_count += 1
+                        engine.logger.secret(
+                            f"玩家{pid + 1}({player.role_name_cn}) 投了 [成功] 票"
+                        )
+                    else:
+                        action_success = evil_actions[pid]
+                        record.mission_votes[PID_STR[pid]] = action_success
+
+                        if action_success:
+                            success_count += 1
+                        else:
+                            fail_count += 1
+
+                        action_text = "成功" if action_success else "失败"
+                        engine.logger.secret(
+                            f"玩家{pid + 1}({player.role_name_cn}) 投了 [{action_text}] 票"
+                        )
+
+                        self.emitter.enqueue(
+                            "agent_mission_vote",
+                            {"player_id": pid, "success": action_success},
+                        )
+
+            # 判定
+            mission_success = fail_count < fail_required
+            record.success = mission_success
 
-        engine.logger.system(
-            f"任务卡翻开: {success_count}张成功票, {fail_count}张失败票"
-        )
-        engine.logger.mission(mission_success)
-        engine.state.mission_results.append(mission_success)
-        engine.logger.score(engine.state.good_wins_count, engine.state.evil_wins_count)
-
-        # 通知所有 Agent
-        event_text = (
-            f"第{round_num + 1}轮任务{'成功' if mission_success else '失败'}！"
-            f"({success_count}张成功票, {fail_count}张失败票) "
-            f"当前比分: 正义 {engine.state.good_wins_count} : {engine.state.evil_wins_count} 邪恶"
-        )
-        for agent in engine.agents.values():
-            agent.observe(event_text)
+            engine.logger.system(
+                f"任务卡翻开: {success_count}张成功票, {fail_count}张失败票"
+            )
+            engine.logger.mission(mission_success)
+            state.record_mission_result(mission_success)
+            engine.logger.score(state.good_wins_count, state.evil_wins_count)
+
+            # 通知所有 Agent
+            event_text = (
+                f"第{round_num + 1}轮任务{'成功' if mission_success else '失败'}！"
+                f"({success_count}张成功票, {fail_count}张失败票) "
+                f"当前比分: 正义 {state.good_wins_count} : {state.evil_wins_count} 邪恶"
+            )
+            engine.observe_all(event_text)
 
-        await self.emitter.emit(
-            "mission_result",
-            {
-                "success": mission_success,
-                "success_count": success_count,
-                "fail_count": fail_count,
-                "round": round_num + 1,
-            },
-        )
-        await self.emitter.emit(
-            "score_update",
-            {
-                "good_wins": engine.state.good_wins_count,
-                "evil_wins": engine.state.evil_wins_count,
-            },
-        )
+            await self.emitter.emit_many([
+                (
+                    "mission_result",
+                    {
+                        "success": mission_success,
+                        "success_count": success_count,
+                        "fail_count": fail_count,
+                        "round": round_num + 1,
+                    },
+                ),
+                (
+                    "score_update",
+                    {
+                        "good_wins": state.good_wins_count,
+                        "evil_wins": state.evil_wins_count,
+                    },
+                ),
+            ])
 
     # ------------------------------------------------------------------
     # 刺杀阶段
     # ------------------------------------------------------------------
 
-    async def _run_assassin_phase(
-        self, engine: GameEngine, loop: asyncio.AbstractEventLoop
-    ) -> dict:
+    async def _run_assassin_phase(self, engine: GameEngine) -> dict:
         await self._checkpoint()
-        await self.emitter.emit("phase_started", {"phase": "assassin"})
-
-        result = await loop.run_in_executor(
-            None,
-            execute_assassin_phase,
-            engine.state,
-            engine.agents,
-            engine.logger,
-        )
 
-        await self.emitter.emit(
-            "assassin_result",
-            {
-                "merlin_killed": result["merlin_killed"],
-                "assassin_id": result["assassin_id"],
-                "target_id": result["target_id"],
-            },
-        )
-        return result
+        async with self._phase("assassin"):
+            result = await self._loop.run_in_executor(
+                self._engine_executor,
+                execute_assassin_phase,
+                engine.state,
+                engine.agents,
+                engine.logger,
+            )
+
+            await self.emitter.emit(
+                "assassin_result",
+                {
+                    "merlin_killed": result["merlin_killed"],
+                    "assassin_id": result["assassin_id"],
+                    "target_id": result["target_id"],
+                },
+            )
+            return result
 
     # ------------------------------------------------------------------
     # 反思阶段（社区模式）
@@ -771,55 +895,57 @@ class AsyncGameRunner:
         game_result: dict,
         agent_manager: PersistentAgentManager,
     ):
-        await self.emitter.emit("phase_started", {"phase": "reflection"})
-
-        loop = asyncio.get_event_loop()
-        reflection_system = ReflectionSystem()
-
-        for player_id, agent in engine.agents.items():
+        async with self._phase("reflection"):
             await self._checkpoint()
 
-            player = engine.state.get_player(player_id)
-            persistent_data = agent_manager.get_agent_data(player.player_name)
+            reflection_system = ReflectionSystem()
 
-            await self.emitter.emit(
-                "agent_thinking",
-                {"player_id": player_id, "action": "reflecting"},
-            )
+            async def _one(player_id: int, agent):
+                player = engine.state.get_player(player_id)
+                persistent_data = agent_manager.get_agent_data(player.player_name)
 
-            try:
-                reflection = await loop.run_in_executor(
-                    None,
-                    reflection_system.reflect,
-                    agent,
-                    game_result,
-                    persistent_data,
-                    agent.memory,
-                )
-            except Exception as e:
-                print(f"  [反思] {player.player_name} 反思异常: {e}")
-                reflection = {"lesson": "反思过程出错", "strategy_update": ""}
+                # 反思的耗时几乎全在 LLM 请求上（等待期间释放 GIL），线程池即可并行；
+                # 进程池需要序列化 Agent 及其记忆，得不偿失
+                try:
+                    reflection = await self._loop.run_in_executor(
+                        self._agent_executor,
+                        reflection_system.reflect,
+                        agent,
+                        game_result,
+                        persistent_data,
+                        agent.memory,
+                    )
+                except Exception as e:
+                    print(f"  [反思] {player.player_name} 反思异常: {e}")
+                    reflection = {"lesson": "反思过程出错", "strategy_update": ""}
 
-            agent_manager.update_agent_reflection(player.player_name, reflection)
+                agent_manager.update_agent_reflection(player.player_name, reflection)
 
-            await self.emitter.emit(
-                "agent_reflection",
-                {
-                    "player_id": player_id,
-                    "player_name": player.player_name,
-                    "lesson": reflection.get("lesson", ""),
-                    "strategy_update": reflection.get("strategy_update", ""),
-                },
-            )
+                await self.emitter.emit(
+                    "agent_reflection",
+                    {
+                        "player_id": player_id,
+                        "player_name": player.player_name,
+                        "lesson": reflection.get("lesson", ""),
+                        "strategy_update": reflection.get("strategy_update", ""),
+                    },
+                )
 
-            # 反思后更新该 Agent 的 profile 卡片
-            updated_data = agent_manager.get_agent_data(player.player_name)
-            await self.emitter.emit(
-                "agent_profile",
-                self._build_agent_profile(player, updated_data),
-            )
+                # 反思后更新该 Agent 的 profile 卡片
+                updated_data = agent_manager.get_agent_data(player.player_name)
+                await self.emitter.emit(
+                    "agent_profile",
+                    self._build_agent_profile(player, updated_data),
+                )
 
-        await self.emitter.emit("phase_completed", {"phase": "reflection"})
+            # 每个 Agent 的反思互相独立，全部同时进行
+            await self.emitter.emit_many([
+                ("agent_thinking", {"player_id": player_id, "action": "reflecting"})
+                for player_id in engine.agents
+            ])
+            await asyncio.gather(*[
+                _one(player_id, agent) for player_id, agent in engine.agents.items()
+            ])
 
     # ------------------------------------------------------------------
     # 私聊阶段（社区模式）
@@ -831,117 +957,99 @@ class AsyncGameRunner:
         game_result: dict,
         agent_manager: PersistentAgentManager,
     ):
-        await self.emitter.emit("phase_started", {"phase": "private_chat"})
-
-        loop = asyncio.get_event_loop()
-        chat_system = PrivateChatSystem()
-
-        chat_pairs = chat_system.select_chat_pairs(
-            list(engine.agents.keys()), game_result
-        )
-
-        if not chat_pairs:
-            await self.emitter.emit("phase_completed", {"phase": "private_chat", "pairs": 0})
-            return
+        async with self._phase("private_chat") as completed:
+            chat_system = PrivateChatSystem()
 
-        for player_a_id, player_b_id in chat_pairs:
-            await self._checkpoint()
+            chat_pairs = chat_system.select_chat_pairs(
+                list(engine.agents.keys()), game_result
+            )
 
-            agent_a = engine.agents[player_a_id]
-            agent_b = engine.agents[player_b_id]
+            if not chat_pairs:
+                completed["pairs"] = 0
+                return
 
-            await self.emitter.emit(
-                "private_chat_start",
-                {
-                    "from_id": player_a_id,
-                    "from_name": agent_a.player_name,
-                    "to_id": player_b_id,
-                    "to_name": agent_b.player_name,
-                    "message": f"{agent_a.player_name} 与 {agent_b.player_name} 开始私聊",
-                },
-            )
+            async def _one_chat(player_a_id: int, player_b_id: int):
+                agent_a = engine.agents[player_a_id]
+                agent_b = engine.agents[player_b_id]
 
-            try:
-                chat_result = await loop.run_in_executor(
-                    None, chat_system.conduct_chat, agent_a, agent_b, game_result
+                await self.emitter.emit(
+                    "private_chat_start",
+                    {
+                        "from_id": player_a_id,
+                        "from_name": agent_a.player_name,
+                        "to_id": player_b_id,
+                        "to_name": agent_b.player_name,
+                        "message": f"{agent_a.player_name} 与 {agent_b.player_name} 开始私聊",
+                    },
                 )
-            except Exception as e:
-                print(f"  [私聊] 执行异常: {e}")
-                chat_result = {
-                    "summary": "私聊异常中断", "topic": "",
-                    "trust_delta_a": 0, "trust_delta_b": 0,
-                    "friendliness_delta_a": 0, "friendliness_delta_b": 0,
-                    "chat_log": [], "relation_note_a": "", "relation_note_b": "",
-                    "strategy_insight_a": "", "strategy_insight_b": "",
-                }
 
-            # 更新社交关系
-            agent_manager.update_social_relation(
-                agent_a.player_name, agent_b.player_name, chat_result
-            )
-            topic = chat_result.get("topic", "")
-            summary = chat_result.get("summary", "")
-            agent_manager.add_private_chat_record(
-                agent_a.player_name, agent_b.player_name, topic, summary
-            )
-            agent_manager.add_private_chat_record(
-                agent_b.player_name, agent_a.player_name, topic, summary
-            )
+                try:
+                    chat_result = await self._loop.run_in_executor(
+                        self._agent_executor, chat_system.conduct_chat, agent_a, agent_b, game_result
+                    )
+                except Exception as e:
+                    print(f"  [私聊] 执行异常: {e}")
+                    chat_result = {
+                        "summary": "私聊异常中断", "topic": "",
+                        "trust_delta_a": 0, "trust_delta_b": 0,
+                        "friendliness_delta_a": 0, "friendliness_delta_b": 0,
+                        "chat_log": [], "relation_note_a": "", "relation_note_b": "",
+                        "strategy_insight_a": "", "strategy_insight_b": "",
+                    }
+
+                # 更新社交关系
+                agent_manager.update_social_relation(
+                    agent_a.player_name, agent_b.player_name, chat_result
+                )
+                topic = chat_result.get("topic", "")
+                summary = chat_result.get("summary", "")
+                agent_manager.add_private_chat_record(
+                    agent_a.player_name, agent_b.player_name, topic, summary
+                )
+                agent_manager.add_private_chat_record(
+                    agent_b.player_name, agent_a.player_name, topic, summary
+                )
 
-            # 发送每条对话消息到前端
-            for speaker_name, msg in chat_result.get("chat_log", []):
-                # 确定发送者和接收者
-                if speaker_name == agent_a.player_name:
-                    from_id, from_name = player_a_id, agent_a.player_name
-                    to_id, to_name = player_b_id, agent_b.player_name
-                else:
-                    from_id, from_name = player_b_id, agent_b.player_name
-                    to_id, to_name = player_a_id, agent_a.player_name
+                # 发送每条对话消息到前端
+                for speaker_name, msg in chat_result.get("chat_log", []):
+                    # 确定发送者和接收者
+                    if speaker_name == agent_a.player_name:
+                        from_id, from_name = player_a_id, agent_a.player_name
+                        to_id, to_name = player_b_id, agent_b.player_name
+                    else:
+                        from_id, from_name = player_b_id, agent_b.player_name
+                        to_id, to_name = player_a_id, agent_a.player_name
+
+                    self.emitter.enqueue(
+                        "private_chat_message",
+                        PrivateChatMsg(from_id, from_name, to_id, to_name, msg),
+                    )
 
                 await self.emitter.emit(
-                    "private_chat_message",
+                    "private_chat_end",
                     {
-                        "from_id": from_id,
-                        "from_name": from_name,
-                        "to_id": to_id,
-                        "to_name": to_name,
-                        "message": msg,
+                        "player_a_id": player_a_id,
+                        "player_b_id": player_b_id,
+                        "player_a_name": agent_a.player_name,
+                        "player_b_name": agent_b.player_name,
+                        "summary": summary,
+                        "analysis": summary,
                     },
                 )
 
-            await self.emitter.emit(
-                "private_chat_end",
-                {
-                    "player_a_id": player_a_id,
-                    "player_b_id": player_b_id,
-                    "player_a_name": agent_a.player_name,
-                    "player_b_name": agent_b.player_name,
-                    "summary": summary,
-                    "analysis": summary,
-                },
-            )
+            # 同一玩家不会同时出现在两场私聊中：按批次调度，批内私聊同时进行
+            for batch in _schedule_chat_batches(chat_pairs):
+                if self._should_yield_cheap():
+                    await self._checkpoint()
+                await asyncio.gather(*[_one_chat(a_id, b_id) for a_id, b_id in batch])
 
-        # 私聊结束后，刷新所有 Agent profile（社交关系已更新）
-        await self._emit_all_agents(engine, agent_manager.agents_data)
-
-        await self.emitter.emit("phase_completed", {"phase": "private_chat"})
+            # 私聊结束后，刷新所有 Agent profile（社交关系已更新）
+            await self._emit_all_agents(engine, agent_manager.agents_data)
 
     # ------------------------------------------------------------------
     # 辅助方法
     # ------------------------------------------------------------------
 
-    def _players_info(self, engine: GameEngine) -> list[dict]:
-        return [
-            {
-                "player_id": p.player_id,
-                "player_name": p.player_name,
-                "role_id": p.role.role_id,
-                "role_name_cn": p.role_name_cn,
-                "team": p.team.value,
-            }
-            for p in engine.state.players
-        ]
-
     def _build_agent_profile(
         self,
         player,
@@ -962,17 +1070,16 @@ class AsyncGameRunner:
             s = persistent_data.statistics
             total_wins = s.wins_as_good + s.wins_as_evil
 
-            # 角色分布字符串
-            role_parts = []
-            if s.times_as_merlin:
-                role_parts.append(f"梅林 ×{s.times_as_merlin}")
-            if s.games_as_good - s.times_as_merlin > 0:
-                role_parts.append(f"其他好人 ×{s.games_as_good - s.times_as_merlin}")
-            if s.times_correct_assassination:
-                role_parts.append(f"刺客(命中) ×{s.times_correct_assassination}")
-            if s.games_as_evil:
-                role_parts.append(f"邪恶 ×{s.games_as_evil}")
-            roles_str = ", ".join(role_parts) if role_parts else "—"
+            # 角色分布字符串：只列出次数大于 0 的项
+            role_counts = (
+                (s.times_as_merlin, "梅林"),
+                (s.games_as_good - s.times_as_merlin, "其他好人"),
+                (s.times_correct_assassination, "刺客(命中)"),
+                (s.games_as_evil, "邪恶"),
+            )
+            roles_str = ", ".join(
+                f"{label} ×{count}" for count, label in role_counts if count > 0
+            ) or "—"
 
             stats = {
                 "games": s.games_played,
@@ -987,19 +1094,21 @@ class AsyncGameRunner:
             else:
                 strategy = sm.evil_strategy_summary or sm.good_strategy_summary
 
-            # 社交关系：转换为前端 [{name, player_id, trust, friendliness}]
+            # 社交关系：转换为前端 [(name, player_id, trust, friendliness), ...]（序列化为数组）
             for other_id, rel in persistent_data.social_relations.items():
                 # other_id 格式为 "player_X"
+                if not other_id.startswith("player_"):
+                    continue
                 try:
-                    other_num = int(other_id.split("_")[1])
-                except (IndexError, ValueError):
+                    other_num = int(other_id[7:])
+                except ValueError:
                     continue
-                social_relations.append({
-                    "name": f"玩家{other_num}",
-                    "player_id": other_num - 1,  # 前端使用 0-based index
-                    "trust": rel.trust,
-                    "friendliness": rel.friendliness,
-                })
+                social_relations.append((
+                    f"玩家{other_num}",
+                    other_num - 1,  # 前端使用 0-based index
+                    rel.trust,
+                    rel.friendliness,
+                ))
 
             # 最近教训：提取字符串列表
             for item in sm.recent_lessons[-3:]:
@@ -1023,20 +1132,37 @@ class AsyncGameRunner:
         self,
         engine: GameEngine,
         agents_data: dict[str, PersistentAgentData] | None = None,
+        full: bool = False,
     ):
-        """发送所有 Agent 的 profile 到前端（all_agents 事件）。"""
-        profiles = []
+        """发送 Agent 的 profile 到前端（all_agents 事件）。
+
+        参数:
+            full: True 时发送全部 profile，前端重建 AGENTS 面板（每局开始时）；
+                  False 时只发送与上次相比有变化的 profile，前端按 player_id 合并
+        """
+        if full:
+            self._last_profile_hash.clear()
+
+        changed = []
         for player in engine.state.players:
             persistent = None
             if agents_data:
                 persistent = agents_data.get(f"player_{player.player_id + 1}")
-            profiles.append(self._build_agent_profile(player, persistent))
-        await self.emitter.emit("all_agents", {"agents": profiles})
+            profile = self._build_agent_profile(player, persistent)
+
+            profile_hash = hash(json.dumps(profile, sort_keys=True, ensure_ascii=False))
+            if self._last_profile_hash.get(player.player_id) != profile_hash:
+                self._last_profile_hash[player.player_id] = profile_hash
+                changed.append(profile)
+
+        if changed or full:
+            await self.emitter.emit("all_agents", {"agents": changed, "full": full})
 
     def _extract_game_result(self, engine: GameEngine) -> dict:
         """与 CommunityRunner._extract_game_result 保持一致"""
+        self._game_seq += 1
         return {
-            "game_id": datetime.now().strftime("%Y%m%d_%H%M%S"),
+            "game_id": f"{int(time.time())}_{self._game_seq}",
             "winner": engine.state.winner,
             "end_reason": engine.state.end_reason,
             "players": [
@@ -1056,6 +1182,24 @@ class AsyncGameRunner:
         }
 
 
+def _schedule_chat_batches(
+    chat_pairs: list[tuple[int, int]],
+) -> list[list[tuple[int, int]]]:
+    """将私聊配对贪心分批，保证同一批次内没有玩家重复出现。"""
+    batches: list[list[tuple[int, int]]] = []
+    busy: list[set[int]] = []
+    for pair in chat_pairs:
+        for batch, members in zip(batches, busy):
+            if pair[0] not in members and pair[1] not in members:
+                batch.append(pair)
+                members.update(pair)
+                break
+        else:
+            batches.append([pair])
+            busy.append(set(pair))
+    return batches
+
+
 class _StopGame(Exception):
     """内部异常：用于中断游戏循环"""
     pass
@@ -12,6 +12,9 @@ from config import COMMUNITY_DATA_DIR
 class CommandHandler:
     """处理来自前端的命令"""
 
+    # 命令名 → 处理函数（未绑定），类定义完成后由 _cmd_* 方法自动生成
+    _COMMANDS: dict = {}
+
     def __init__(
         self,
         runner: AsyncGameRunner,
@@ -33,11 +36,11 @@ class CommandHandler:
         Returns:
             响应字典 {"ok": bool, ...}
         """
-        handler = getattr(self, f"_cmd_{cmd}", None)
+        handler = self._COMMANDS.get(cmd)
         if handler is None:
             return {"ok": False, "error": f"未知命令: {cmd}"}
         try:
-            return await handler(params)
+            return await handler(self, params)
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
@@ -57,11 +60,11 @@ class CommandHandler:
 
         if mode == "community":
             continuous = bool(params.get("continuous", False))
-            asyncio.ensure_future(
-                self.runner.run_community_session(num_games, continuous=continuous)
-            )
+            coro = self.runner.run_community_session(num_games, continuous=continuous)
         else:
-            asyncio.ensure_future(self.runner.run_single_game())
+            coro = self.runner.run_single_game()
+        # 保存任务引用：既防止任务被垃圾回收，也便于 stop 时取消
+        self.runner._task = asyncio.get_running_loop().create_task(coro)
 
         return {"ok": True, "mode": mode, "num_games": num_games, "step_mode": step_mode}
 
@@ -82,6 +85,10 @@ class CommandHandler:
         return {"ok": True, "state": self.runner.state}
 
     async def _cmd_stop(self, params: dict) -> dict:
+        # 取消运行任务，使其立即从当前的 await（如等待 LLM 返回）中退出
+        task = self.runner._task
+        if task is not None and not task.done():
+            task.cancel()
         self.runner.stop()
         return {"ok": True, "state": self.runner.state}
 
@@ -130,3 +137,8 @@ class CommandHandler:
                 changed[upper_key] = value
 
         return {"ok": True, "changed": changed}
+
+
+CommandHandler._COMMANDS = {
+    name[5:]: fn for name, fn in vars(CommandHandler).items() if name.startswith("_cmd_")
+}
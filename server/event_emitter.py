@@ -3,44 +3,250 @@
 import json
 import time
 import asyncio
+from dataclasses import asdict, dataclass, is_dataclass
+from functools import partial
 
-from aiohttp import web
+from aiohttp import web, WSCloseCode, WSMsgType
+
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时退回标准库
+    orjson = None
+
+
+# 每个客户端最多积压的待发送帧数，超出即视为跟不上广播速度并断开
+CLIENT_QUEUE_SIZE = 64
+
+# 后台任务每次最多从队列取出多少条积压消息合并为一帧
+EMIT_DRAIN_LIMIT = 32
+
+
+# ------------------------------------------------------------------
+# 高频事件的数据类型（slots 数据类，比同字段的 dict 更省内存）
+# ------------------------------------------------------------------
+
+@dataclass(slots=True)
+class PrivateChatMsg:
+    """private_chat_message 事件数据"""
+    from_id: int
+    from_name: str
+    to_id: int
+    to_name: str
+    message: str
+
+
+def _json_default(obj):
+    """标准库 json 的兜底：数据类按字段转为 dict"""
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode(message: dict) -> bytes:
+    """将事件消息编码为 UTF-8 JSON 字节串（整数键直接写成字符串键，数据类按字段展开）"""
+    if orjson is not None:
+        # orjson 原生支持数据类，无需额外选项
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(message, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def _coalesce(messages: list[dict]) -> dict:
+    """
+    将积压的多条消息合并为一条 batch 消息。
+
+    相邻的 all_agents 增量按 player_id 合并为一条（后者覆盖前者），
+    其余事件保持原有顺序。
+    """
+    if len(messages) == 1:
+        return messages[0]
+
+    events: list[dict] = []
+    for message in messages:
+        if message["type"] == "batch":
+            events.extend(message["events"])
+        else:
+            events.append(message)
+
+    merged: list[dict] = []
+    for event in events:
+        prev = merged[-1] if merged else None
+        if event["type"] == "all_agents" and prev is not None and prev["type"] == "all_agents":
+            agents = {p["player_id"]: p for p in prev["data"]["agents"]}
+            agents.update((p["player_id"], p) for p in event["data"]["agents"])
+            merged[-1] = {
+                "type": "all_agents",
+                "data": {
+                    "agents": list(agents.values()),
+                    "full": prev["data"]["full"] or event["data"]["full"],
+                },
+                "timestamp": event["timestamp"],
+            }
+        else:
+            merged.append(event)
+
+    return {"type": "batch", "events": merged}
 
 
 class EventEmitter:
-    """向所有已连接的 WebSocket 客户端广播游戏事件"""
+    """向所有已连接的 WebSocket 客户端广播游戏事件
+
+    事件先进入队列，由后台任务负责序列化和发送，游戏主流程无需等待网络 I/O。
+    队列保证事件按入队顺序送达；需要确认已全部送出时调用 flush()。
+    后台任务每次取出队列中全部积压的消息（至多 EMIT_DRAIN_LIMIT 条），合并为一帧发送。
+    事件以 UTF-8 JSON 二进制帧发送（前端以 ArrayBuffer 接收后解码）。
+
+    每个客户端有独立的有界发送队列和写任务：广播只把帧放进各客户端队列，
+    慢客户端不会拖慢其他客户端；队列写满的客户端会被断开。
+
+    没有客户端连接时（如无前端的社区模式）事件直接丢弃，不入队也不序列化；
+    GameLogger 的终端输出和日志文件与广播无关，照常写入。
+    """
 
     def __init__(self):
-        self.clients: set[web.WebSocketResponse] = set()
+        # 客户端 → 写任务
+        self._writers: dict[web.WebSocketResponse, asyncio.Task] = {}
+        # 广播目标 (客户端, 发送队列)：增删客户端时整体重建（写时复制），广播时直接遍历
+        self._targets: tuple[tuple[web.WebSocketResponse, asyncio.Queue], ...] = ()
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._closing: set[asyncio.Task] = set()  # 正在关闭的慢客户端连接
+        # 事件时间戳 = loop.time() + 偏移，偏移在后台任务启动时按墙钟校准一次
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._clock_offset = 0.0
+
+    @property
+    def clients(self) -> tuple[web.WebSocketResponse, ...]:
+        """当前已连接的客户端"""
+        return tuple(ws for ws, _queue in self._targets)
 
     def add_client(self, ws: web.WebSocketResponse):
-        """注册新的 WebSocket 客户端"""
-        self.clients.add(ws)
+        """注册新的 WebSocket 客户端，并启动它的写任务"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self._writers[ws] = asyncio.get_running_loop().create_task(self._client_writer(ws, queue))
+        self._targets = (*self._targets, (ws, queue))
 
     def remove_client(self, ws: web.WebSocketResponse):
-        """移除已断开的 WebSocket 客户端"""
-        self.clients.discard(ws)
+        """移除已断开的 WebSocket 客户端，并停止它的写任务"""
+        task = self._detach(ws)
+        if task is not None:
+            task.cancel()
 
-    async def emit(self, event_type: str, data: dict):
+    def _detach(self, ws: web.WebSocketResponse) -> asyncio.Task | None:
+        """将客户端移出广播目标，返回它的写任务（不取消）"""
+        task = self._writers.pop(ws, None)
+        if task is not None:
+            self._targets = tuple(t for t in self._targets if t[0] is not ws)
+        return task
+
+    def enqueue(self, event_type: str, data: dict | PrivateChatMsg):
         """
-        向所有客户端广播一条事件消息。
+        将一条事件放入发送队列（不等待发送完成）。
+        data 在实际发送时才序列化，入队后调用方不应再修改它。
 
         消息格式:
             {"type": event_type, "data": data, "timestamp": <unix_ts>}
         """
-        message = json.dumps(
-            {"type": event_type, "data": data, "timestamp": time.time()},
-            ensure_ascii=False,
+        if not self._targets:
+            return
+        self._ensure_worker()
+        self._queue.put_nowait(
+            {"type": event_type, "data": data, "timestamp": self._now()}
         )
 
-        dead_clients: list[web.WebSocketResponse] = []
+    async def emit(self, event_type: str, data: dict):
+        """广播一条事件消息（入队后立即返回）"""
+        self.enqueue(event_type, data)
+
+    async def emit_many(self, events: list[tuple[str, dict]]):
+        """
+        将多条事件合并为一条消息广播，前端按顺序逐条分发。
+
+        消息格式:
+            {"type": "batch", "events": [{"type", "data", "timestamp"}, ...]}
+        """
+        if not events or not self._targets:
+            return
+        self._ensure_worker()
+        ts = self._now()
+        self._queue.put_nowait({
+            "type": "batch",
+            "events": [
+                {"type": event_type, "data": data, "timestamp": ts}
+                for event_type, data in events
+            ],
+        })
+
+    async def flush(self):
+        """等待队列中已有的事件全部交给各客户端的写任务"""
+        if self._queue is not None and self._worker is not None and not self._worker.done():
+            await self._queue.join()
 
-        for ws in self.clients:
+    def _ensure_worker(self):
+        """按需启动后台发送任务"""
+        if self._worker is None or self._worker.done():
+            loop = asyncio.get_running_loop()
+            self._loop = loop
+            self._clock_offset = time.time() - loop.time()
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._emit_worker())
+
+    def _now(self) -> float:
+        """当前 unix 时间戳（由事件循环的单调时钟换算，不必每条事件读取墙钟）"""
+        return self._clock_offset + self._loop.time()
+
+    async def _emit_worker(self):
+        """后台任务：取出积压的事件，合并后序列化并广播"""
+        queue = self._queue
+        while True:
+            messages = [await queue.get()]
+            while len(messages) < EMIT_DRAIN_LIMIT and not queue.empty():
+                messages.append(queue.get_nowait())
             try:
-                await ws.send_str(message)
-            except Exception:
-                dead_clients.append(ws)
+                # 入队后客户端可能已全部断开，此时无需再编码
+                if self._targets:
+                    # 只编码一次，所有客户端共享同一份 UTF-8 字节帧
+                    await self._broadcast(_encode(_coalesce(messages)))
+            except Exception as e:
+                print(f"[Emitter] 事件发送失败 ({messages[0].get('type')} 等 {len(messages)} 条): {e}")
+            finally:
+                for _ in messages:
+                    queue.task_done()
+            # 让出一次事件循环，使各客户端的写任务在连续的事件之间得以推进
+            await asyncio.sleep(0)
+
+    async def _broadcast(self, frame: bytes):
+        """将已编码的二进制帧放入每个客户端的发送队列（不等待网络写入）"""
+        slow_clients: list[web.WebSocketResponse] = []
+
+        for ws, queue in self._targets:
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                slow_clients.append(ws)
+
+        # 断开跟不上的客户端；前端会自动重连并重新同步
+        for ws in slow_clients:
+            print("[Emitter] 客户端发送队列已满，断开连接")
+            self.remove_client(ws)
+            task = asyncio.get_running_loop().create_task(
+                ws.close(code=WSCloseCode.TRY_AGAIN_LATER, message=b"send queue full")
+            )
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+    async def _client_writer(self, ws: web.WebSocketResponse, queue: asyncio.Queue):
+        """单个客户端的写任务：按顺序把队列中的帧写入连接"""
+        # 帧已是编码好的 bytes：aiohttp >= 3.11 的 send_frame 直接写出，省去 send_bytes 的类型检查
+        if hasattr(ws, "send_frame"):
+            send = partial(ws.send_frame, opcode=WSMsgType.BINARY)
+        else:
+            send = ws.send_bytes
 
-        # 清理已失效的连接
-        for ws in dead_clients:
-            self.clients.discard(ws)
+        while True:
+            frame = await queue.get()
+            try:
+                await send(frame)
+            except Exception:
+                # 连接已失效，停止写入并移除客户端
+                self._detach(ws)
+                return
@@ -17,13 +17,27 @@ if _AVALON_ROOT not in sys.path:
 
 from aiohttp import web
 
-from server.event_emitter import EventEmitter
+try:
+    import orjson
+except ImportError:  # orjson 为可选依赖，缺失时退回标准库
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop 为可选依赖，缺失时使用 asyncio 默认事件循环
+    uvloop = None
+
+from server.event_emitter import EventEmitter, _encode
 from server.async_game_runner import AsyncGameRunner
 from server.commands import CommandHandler
 from community.persistent_agent import PersistentAgentManager
 from config import COMMUNITY_DATA_DIR
 
 
+# 解析客户端命令；orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，两者可统一捕获
+_loads = orjson.loads if orjson is not None else json.loads
+
+
 # ------------------------------------------------------------------
 # WebSocket 处理
 # ------------------------------------------------------------------
@@ -43,7 +57,7 @@ async def websocket_handler(request: web.Request) -> web.WebSocketResponse:
         async for msg in ws:
             if msg.type == web.WSMsgType.TEXT:
                 try:
-                    payload = json.loads(msg.data)
+                    payload = _loads(msg.data)
                     cmd = payload.get("cmd", "")
                     params = payload.get("params", {})
                     if not cmd:
@@ -51,9 +65,9 @@ async def websocket_handler(request: web.Request) -> web.WebSocketResponse:
                         params = payload
 
                     response = await cmd_handler.handle(cmd, params)
-                    await ws.send_json({"type": "response", "cmd": cmd, "data": response})
+                    await ws.send_bytes(_encode({"type": "response", "cmd": cmd, "data": response}))
                 except json.JSONDecodeError:
-                    await ws.send_json({"type": "error", "data": {"error": "JSON 解析失败"}})
+                    await ws.send_bytes(_encode({"type": "error", "data": {"error": "JSON 解析失败"}}))
             elif msg.type == web.WSMsgType.ERROR:
                 print(f"[WS] 连接异常: {ws.exception()}")
     finally:
@@ -108,9 +122,13 @@ def start_server(host: str = None, port: int = None):
     """启动服务器"""
     host = host or os.getenv("AVALON_HOST", "0.0.0.0")
     port = port or int(os.getenv("AVALON_PORT", "8080"))
+    # 须在 web.run_app 创建事件循环之前安装
+    if uvloop is not None:
+        uvloop.install()
     app = create_app()
     print(f"[Server] 启动 Avalon WebSocket 服务器: http://{host}:{port}")
     print(f"[Server] WebSocket 端点: ws://{host}:{port}/ws")
+    print(f"[Server] 事件循环: {'uvloop' if uvloop is not None else 'asyncio'}")
     web.run_app(app, host=host, port=port, print=None)
 
 
@@ -1,7 +1,9 @@
 """游戏日志系统 - 终端彩色输出 + 文件记录"""
 
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
 from typing import Callable, Optional
 
@@ -19,6 +21,28 @@ _COLORS = {
     "white": "\033[97m",     # 普通文本
 }
 
+# 高频输出方法的彩色模板（预先拼好颜色码，调用时只需 format）
+_PHASE_LINE = "-" * 50
+_THINKING_TPL = f"{_COLORS['gray']}[思考中] {{}}正在{{}}...{_COLORS['reset']}"
+_PHASE_TPL = f"\n{_COLORS['magenta']}{_COLORS['bold']}>>> {{}}\n{_PHASE_LINE}{_COLORS['reset']}"
+_SYSTEM_TPL = f"{_COLORS['cyan']}[系统] {{}}{_COLORS['reset']}"
+_GOOD_TPL = f"{_COLORS['blue']}[{{}}] {{}}{_COLORS['reset']}"
+_EVIL_TPL = f"{_COLORS['red']}[{{}}] {{}}{_COLORS['reset']}"
+_VOTE_APPROVE_TPL = f"{_COLORS['yellow']}[投票] {_COLORS['reset']}{{}}: {_COLORS['green']}同意{_COLORS['reset']}"
+_VOTE_REJECT_TPL = f"{_COLORS['yellow']}[投票] {_COLORS['reset']}{{}}: {_COLORS['red']}反对{_COLORS['reset']}"
+_SCORE_TPL = (
+    f"{_COLORS['bold']}[比分] "
+    f"{_COLORS['blue']}正义 {{}} "
+    f"{_COLORS['white']}: "
+    f"{_COLORS['red']}{{}} 邪恶"
+    f"{_COLORS['reset']}"
+)
+_INFO_TPL = f"{_COLORS['gray']}{{}}{_COLORS['reset']}"
+
+# 日志文件后台写入：攒够一批或空闲一段时间后再写盘
+_FILE_BATCH_CHARS = 16 * 1024
+_FILE_FLUSH_INTERVAL = 0.1  # 秒
+
 
 class GameLogger:
     """游戏日志管理器"""
@@ -32,12 +56,53 @@ class GameLogger:
         self.log_file = os.path.join(log_dir, f"game_{timestamp}.log")
         self._file = open(self.log_file, "w", encoding="utf-8")
 
+        # 文件写入交给后台线程，调用方只需入队，不在游戏流程中等待磁盘 I/O
+        self._file_queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._file_writer = threading.Thread(
+            target=self._drain_file_queue, name="game-logger", daemon=True
+        )
+        self._file_writer.start()
+
         self.banner("阿瓦隆 - 多Agent沙盘模拟")
         self.system(f"日志文件: {self.log_file}")
 
     def _write_file(self, text: str):
         """写入文件（不含颜色码）"""
-        self._file.write(text + "\n")
+        self._file_queue.put(text)
+
+    def _drain_file_queue(self):
+        """后台线程：批量写入日志行，空闲超时或关闭时落盘"""
+        pending: list[str] = []
+        pending_chars = 0
+        dirty = False  # 是否有已写入但尚未 flush 的内容
+
+        while True:
+            # 有未落盘内容时限时等待，超时即 flush；否则一直阻塞到下一行
+            timeout = _FILE_FLUSH_INTERVAL if dirty or pending else None
+            try:
+                text = self._file_queue.get(timeout=timeout)
+            except queue.Empty:
+                if pending:
+                    self._file.write("".join(pending))
+                    pending.clear()
+                    pending_chars = 0
+                self._file.flush()
+                dirty = False
+                continue
+
+            if text is None:  # close() 发出的结束信号
+                break
+
+            pending.append(text + "\n")
+            pending_chars += len(text) + 1
+            if pending_chars >= _FILE_BATCH_CHARS:
+                self._file.write("".join(pending))
+                pending.clear()
+                pending_chars = 0
+                dirty = True
+
+        if pending:
+            self._file.write("".join(pending))
         self._file.flush()
 
     def _print(self, colored_text: str, plain_text: str):
@@ -55,9 +120,10 @@ class GameLogger:
 
     def thinking_start(self, player_id: int, player_name: str, action: str):
         """标记玩家开始思考（LLM调用开始）"""
-        colored = f"{_COLORS['gray']}[思考中] {player_name}正在{action}...{_COLORS['reset']}"
-        plain = f"[思考中] {player_name}正在{action}..."
-        self._print(colored, plain)
+        self._print(
+            _THINKING_TPL.format(player_name, action),
+            f"[思考中] {player_name}正在{action}...",
+        )
         self._emit_event("agent_thinking", {
             "player_id": player_id,
             "player_name": player_name,
@@ -87,36 +153,20 @@ class GameLogger:
 
     def phase(self, text: str):
         """阶段标题"""
-        line = "-" * 50
-        colored = (
-            f"\n{_COLORS['magenta']}{_COLORS['bold']}"
-            f">>> {text}\n{line}{_COLORS['reset']}"
-        )
-        plain = f"\n>>> {text}\n{line}"
-        self._print(colored, plain)
+        self._print(_PHASE_TPL.format(text), f"\n>>> {text}\n{_PHASE_LINE}")
         self._emit_event("phase", {"text": text})
 
     def system(self, text: str):
         """系统消息"""
-        colored = f"{_COLORS['cyan']}[系统] {text}{_COLORS['reset']}"
-        plain = f"[系统] {text}"
-        self._print(colored, plain)
+        self._print(_SYSTEM_TPL.format(text), f"[系统] {text}")
 
     def good(self, player_name: str, text: str):
         """好人阵营发言"""
-        colored = (
-            f"{_COLORS['blue']}[{player_name}] {text}{_COLORS['reset']}"
-        )
-        plain = f"[{player_name}] {text}"
-        self._print(colored, plain)
+        self._print(_GOOD_TPL.format(player_name, text), f"[{player_name}] {text}")
 
     def evil(self, player_name: str, text: str):
         """坏人阵营发言"""
-        colored = (
-            f"{_COLORS['red']}[{player_name}] {text}{_COLORS['reset']}"
-        )
-        plain = f"[{player_name}] {text}"
-        self._print(colored, plain)
+        self._print(_EVIL_TPL.format(player_name, text), f"[{player_name}] {text}")
 
     def speech(self, player_name: str, team: str, text: str, player_id: int = None):
         """玩家发言（根据阵营自动着色）"""
@@ -133,11 +183,9 @@ class GameLogger:
 
     def vote(self, player_name: str, approved: bool, player_id: int = None):
         """投票结果"""
+        tpl = _VOTE_APPROVE_TPL if approved else _VOTE_REJECT_TPL
         result = "同意" if approved else "反对"
-        color = _COLORS["green"] if approved else _COLORS["red"]
-        colored = f"{_COLORS['yellow']}[投票] {_COLORS['reset']}{player_name}: {color}{result}{_COLORS['reset']}"
-        plain = f"[投票] {player_name}: {result}"
-        self._print(colored, plain)
+        self._print(tpl.format(player_name), f"[投票] {player_name}: {result}")
         self._emit_event("agent_vote", {
             "player_id": player_id,
             "player_name": player_name,
@@ -157,15 +205,10 @@ class GameLogger:
 
     def score(self, good_wins: int, evil_wins: int):
         """当前比分"""
-        colored = (
-            f"{_COLORS['bold']}[比分] "
-            f"{_COLORS['blue']}正义 {good_wins} "
-            f"{_COLORS['white']}: "
-            f"{_COLORS['red']}{evil_wins} 邪恶"
-            f"{_COLORS['reset']}"
+        self._print(
+            _SCORE_TPL.format(good_wins, evil_wins),
+            f"[比分] 正义 {good_wins} : {evil_wins} 邪恶",
         )
-        plain = f"[比分] 正义 {good_wins} : {evil_wins} 邪恶"
-        self._print(colored, plain)
         self._emit_event("score", {"good_wins": good_wins, "evil_wins": evil_wins})
 
     def result(self, text: str, good_wins: bool):
@@ -183,15 +226,16 @@ class GameLogger:
 
     def info(self, text: str):
         """普通信息"""
-        colored = f"{_COLORS['gray']}{text}{_COLORS['reset']}"
-        plain = text
-        self._print(colored, plain)
+        self._print(_INFO_TPL.format(text), text)
 
     def secret(self, text: str):
         """秘密信息（仅写入日志文件，不在终端显示全部细节）"""
         self._write_file(f"[秘密] {text}")
 
     def close(self):
-        """关闭日志文件"""
+        """写完剩余日志并关闭日志文件"""
+        if self._file_writer.is_alive():
+            self._file_queue.put(None)
+            self._file_writer.join()
         if not self._file.closed:
             self._file.close()
@@ -429,18 +429,16 @@ class DashboardRenderer {
    * Render a single agent profile in the AGENTS tab
    * @param {object} data - { player_id, player_name, role_id, role_name_cn, team,
    *                          stats: {games, wins, roles}, strategy, social_relations, lessons }
+   *                        social_relations entries are [name, player_id, trust, friendliness] arrays
    */
   renderAgentProfile(data) {
     const container = document.getElementById('agents-content');
     if (!container) return;
 
-    // Check if profile card already exists
-    let card = container.querySelector(`[data-agent-id="${data.player_id}"]`);
-    if (card) {
-      card.remove();
-    }
+    // An existing card for this agent is replaced in place (keeps card order)
+    const existing = container.querySelector(`[data-agent-id="${data.player_id}"]`);
 
-    card = document.createElement('div');
+    const card = document.createElement('div');
     card.className = 'agent-profile-card';
     card.dataset.agentId = data.player_id;
 
@@ -469,12 +467,12 @@ class DashboardRenderer {
           '<span class="legend-item"><span class="legend-dot trust-dot"></span>信任</span>' +
           '<span class="legend-item"><span class="legend-dot friend-dot"></span>友好</span>' +
         '</div>';
-      data.social_relations.forEach(rel => {
-        const trustPct = Math.max(0, Math.min(100, (rel.trust || 0) * 100));
-        const friendPct = Math.max(0, Math.min(100, (rel.friendliness || 0) * 100));
+      data.social_relations.forEach(([name, playerId, trust, friendliness]) => {
+        const trustPct = Math.max(0, Math.min(100, (trust || 0) * 100));
+        const friendPct = Math.max(0, Math.min(100, (friendliness || 0) * 100));
         relationsHtml +=
           '<div class="relation-row">' +
-            '<span class="relation-name">' + this._escapeHtml(rel.name || 'P' + rel.player_id) + '</span>' +
+            '<span class="relation-name">' + this._escapeHtml(name || 'P' + playerId) + '</span>' +
             '<div class="relation-bars">' +
               '<div class="trust-bar-container" title="信任 ' + trustPct.toFixed(0) + '%">' +
                 '<div class="trust-bar" style="width: ' + trustPct + '%"></div>' +
@@ -510,16 +508,22 @@ class DashboardRenderer {
       relationsHtml +
       lessonsHtml;
 
-    container.appendChild(card);
+    if (existing) {
+      container.replaceChild(card, existing);
+    } else {
+      container.appendChild(card);
+    }
   }
 
   /**
-   * Render all 6 agent profile cards
-   * @param {object} data - { agents: [agentData, ...] }
+   * Render agent profile cards
+   * @param {object} data - { agents: [agentData, ...], full }
+   *   full=true rebuilds the panel; otherwise only the changed agents are sent
+   *   and merged into the existing cards by player_id
    */
   renderAllAgents(data) {
     const container = document.getElementById('agents-content');
-    if (container) container.innerHTML = '';
+    if (container && data.full !== false) container.innerHTML = '';
 
     (data.agents || []).forEach(agent => {
       this.renderAgentProfile(agent);
@@ -12,6 +12,7 @@ class WebSocketClient {
     this.autoReconnect = true;
     this.onStateChange = null;    // callback for connection state changes
     this._reconnectTimer = null;
+    this._decoder = new TextDecoder('utf-8');  // server events arrive as UTF-8 binary frames
   }
 
   /**
@@ -24,6 +25,7 @@ class WebSocketClient {
 
     try {
       this.ws = new WebSocket(this.url);
+      this.ws.binaryType = 'arraybuffer';
       this.ws.onopen = () => this._handleOpen();
       this.ws.onclose = (e) => this._handleClose(e);
       this.ws.onerror = (err) => this._handleError(err);
@@ -94,17 +96,32 @@ class WebSocketClient {
   }
 
   /**
-   * Parse incoming JSON message and dispatch to registered handlers
+   * Parse incoming JSON message and dispatch to registered handlers.
+   * Server events and command responses arrive as binary (ArrayBuffer) UTF-8 frames.
    */
   _handleMessage(event) {
+    const raw = typeof event.data === 'string' ? event.data : this._decoder.decode(event.data);
     let data;
     try {
-      data = JSON.parse(event.data);
+      data = JSON.parse(raw);
     } catch (err) {
-      console.error('[WS] Failed to parse message:', err, event.data);
+      console.error('[WS] Failed to parse message:', err, raw);
       return;
     }
 
+    // Batched events are unrolled and dispatched in order
+    if (data.type === 'batch' && Array.isArray(data.events)) {
+      data.events.forEach(item => this._dispatch(item));
+      return;
+    }
+
+    this._dispatch(data);
+  }
+
+  /**
+   * Dispatch a single parsed event to registered handlers
+   */
+  _dispatch(data) {
     const eventType = data.type || data.event;
     if (!eventType) {
       console.warn('[WS] Message has no type/event field:', data);